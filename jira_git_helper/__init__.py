@@ -1,9 +1,16 @@
-from importlib.metadata import version, PackageNotFoundError
+# __version__ is resolved on first access (PEP 562) — importlib.metadata is
+# noticeable on the `eval (jg hook)` shell-startup path, which never needs it.
+def __getattr__(name: str) -> str:
+    if name == "__version__":
+        from importlib.metadata import version, PackageNotFoundError
 
-try:
-    __version__ = version("jira-git-helper")
-except PackageNotFoundError:
-    __version__ = "unknown"
+        try:
+            value = version("jira-git-helper")
+        except PackageNotFoundError:
+            value = "unknown"
+        globals()["__version__"] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # cli.main is imported lazily — the entry point in pyproject.toml
 # points directly to jira_git_helper.cli:main
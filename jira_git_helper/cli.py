@@ -2,62 +2,122 @@
 
 from __future__ import annotations
 
-import json
+import re
 import subprocess
 import sys
 import webbrowser
+from functools import cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
-import requests
-from jira import JIRAError
+
+if TYPE_CHECKING:
+    from rich.console import Console
 
 from .config import (
     STATE_FILE,
     get_config,
     set_config,
+    set_config_many,
     get_ticket,
     save_ticket,
     clear_ticket,
     get_projects,
     get_fields_for_project,
     get_filters_for_project,
-    set_filters_for_project,
     get_active_filter_name,
-    set_active_filter_name,
     get_formatters,
     set_formatters,
     get_effective_filter_name,
-    _read_config,
-    _write_config,
+    _json_dumps,
+    _json_dumps_pretty,
+    _load_config,
     _session_active_filters,
 )
 from .git import (
     get_file_statuses,
+    get_git_root,
     get_current_branch,
     check_not_main_branch,
     get_default_branch,
+    get_branch_context,
+    get_prunable_branches,
     get_ticket_branches,
     create_branch,
     switch_branch,
+    invalidate_git_cache,
 )
 from .jira_api import (
     get_jira_server,
     get_jira_client,
-    ensure_fields_cached,
-    get_jira_field_name,
+    get_jira_field_names,
+    get_issue_raw,
     fetch_issues_for_projects,
     get_prs,
     get_gh_prs,
+    ISSUE_FIELDS,
+    TREE_FIELDS,
+    TICKET_INFO_FIELDS,
     STATUS_STYLES,
     PRIORITY_STYLES,
 )
 from .formatters import run_formatters
-from . import __version__
+
+# "Create a pull request" link the remote prints on the first push of a branch
+_PULL_NEW_URL_RE = re.compile(r"https://\S*/pull/new/\S*")
+
+
+def _http_error_text(e) -> str:
+    """Return JIRA's errorMessages from a failed REST response, or the HTTP error itself."""
+    try:
+        body = e.response.json()
+    except ValueError:
+        body = None
+    messages = body.get("errorMessages") if isinstance(body, dict) else None
+    return "; ".join(messages) if messages else str(e)
+
+
+@cache
+def _console() -> Console:
+    """Process-wide Rich console, built on first use (probes the terminal once)."""
+    from rich.console import Console
+
+    return Console()
+
+
+def _ensure_ticket() -> str:
+    """Return the current ticket, loading the Textual picker only when none is set.
+
+    Commands that never show a TUI (jg push, jg branch <name>) then skip the
+    textual import entirely.
+    """
+    ticket = get_ticket()
+    if ticket:
+        return ticket
+    from .tui.ticket_picker import ensure_ticket
+
+    return ensure_ticket()
+
+
+def _version() -> str:
+    from . import __version__  # resolved lazily — see __init__.py
+
+    return __version__
+
+
+def _print_version(ctx: click.Context, param: click.Parameter, value: bool) -> None:
+    if not value or ctx.resilient_parsing:
+        return
+    click.echo(f"jg, version {_version()}")
+    ctx.exit()
 
 
 @click.group(invoke_without_command=True)
-@click.version_option(__version__, prog_name="jg")
+@click.option(
+    "--version", is_flag=True, expose_value=False, is_eager=True,
+    callback=_print_version, help="Show the version and exit.",
+)
 @click.pass_context
 def main(ctx: click.Context) -> None:
     """Manage JIRA ticket context for git workflows."""
@@ -84,24 +144,26 @@ def cmd_set(ticket: str | None, jql: str | None, max_results: int) -> None:
         click.echo(f"Ticket set to {ticket}")
         return
 
+    from jira import JIRAError
+
     from .tui.ticket_picker import JiraListApp
 
     jira = get_jira_client()
-    ensure_fields_cached(jira)
     projects = get_projects()
 
-    # Migrate any legacy jql.<PROJECT> config keys to named filters
+    # Migrate any legacy jql.<PROJECT> config keys to named filters (one write for all)
+    migration: dict[str, str | None] = {}
     for proj in projects:
         legacy_jql = get_config(f"jql.{proj}")
         if legacy_jql:
             if not get_filters_for_project(proj):
-                set_filters_for_project(proj, [{"name": "Default", "jql": legacy_jql}])
-                set_active_filter_name(proj, "Default")
+                migration[f"filters.{proj}"] = _json_dumps([{"name": "Default", "jql": legacy_jql}])
+                migration[f"filters.{proj}.default"] = "Default"
                 _session_active_filters[proj] = "Default"
                 click.echo(f"Migrated jql.{proj} to a named filter 'Default'.", err=True)
-            cfg = _read_config()
-            cfg.pop(f"jql.{proj}", None)
-            _write_config(cfg)
+            migration[f"jql.{proj}"] = None
+    if migration:
+        set_config_many(migration)
 
     def _collect_extra_fields() -> tuple[list[str], dict[str, str]]:
         seen: set[str] = set()
@@ -111,18 +173,17 @@ def cmd_set(ticket: str | None, jql: str | None, max_results: int) -> None:
                 if fid not in seen:
                     seen.add(fid)
                     ordered.append(fid)
-        names = {fid: get_jira_field_name(fid) for fid in ordered}
-        return ordered, names
+        return ordered, get_jira_field_names(jira, ordered)
 
     extra_field_ids, field_names = _collect_extra_fields()
 
     click.echo("Fetching tickets…", err=True)
     try:
         if jql:
-            issues = list(jira.search_issues(
+            issues = jira.search_issues(
                 jql, maxResults=max_results,
-                fields=["summary", "status", "assignee", "priority", "parent", "issuetype"] + extra_field_ids,
-            ))
+                fields=ISSUE_FIELDS + TREE_FIELDS + extra_field_ids,
+            )
         else:
             issues = fetch_issues_for_projects(jira, projects, max_results, extra_field_ids)
     except JIRAError as e:
@@ -146,7 +207,9 @@ def cmd_set(ticket: str | None, jql: str | None, max_results: int) -> None:
             extra_field_ids, field_names = _collect_extra_fields()
             click.echo("Reloading with updated fields…", err=True)
             try:
-                issues = fetch_issues_for_projects(jira, projects, max_results, extra_field_ids)
+                issues = fetch_issues_for_projects(
+                    jira, projects, max_results, extra_field_ids, use_cache=False
+                )
             except JIRAError as e:
                 raise click.ClickException(f"JIRA API error: {e.text}") from e
             continue
@@ -169,25 +232,25 @@ def cmd_clear() -> None:
 @main.command("version")
 def cmd_version() -> None:
     """Show the jg version."""
-    click.echo(f"jg {__version__}")
+    click.echo(f"jg {_version()}")
 
 
 @main.command("branch")
 @click.argument("name", required=False)
 def cmd_branch(name: str | None) -> None:
     """Switch to a ticket branch interactively, or create one with the given name."""
-    from .tui.branch import BranchPromptApp, BranchPickerApp
-    from .tui.ticket_picker import ensure_ticket
-
-    ticket = ensure_ticket()
+    ticket = _ensure_ticket()
 
     if name:
         branch_name = f"{ticket}-{name}"
         create_branch(branch_name, get_default_branch())
         return
 
+    from .tui.branch import BranchPromptApp, BranchPickerApp
+
     click.echo("Fetching branches…", err=True)
     subprocess.run(["git", "fetch", "--prune"], capture_output=True, text=True)
+    invalidate_git_cache()
     branches = get_ticket_branches(ticket)
 
     if not branches:
@@ -218,9 +281,8 @@ def cmd_add() -> None:
     """Interactively stage and unstage files."""
     from .tui.branch import BranchPromptApp
     from .tui.file_picker import FilePickerApp
-    from .tui.ticket_picker import ensure_ticket
 
-    ticket = ensure_ticket()
+    ticket = _ensure_ticket()
 
     if get_current_branch() in ("main", "master"):
         jira_client = get_jira_client()
@@ -238,18 +300,16 @@ def cmd_add() -> None:
         click.echo("Nothing to do — working tree clean.")
         return
 
-    app = FilePickerApp(staged, modified, deleted, untracked)
+    git_root = get_git_root()
+
+    app = FilePickerApp(staged, modified, deleted, untracked, git_root=git_root, ticket=ticket)
     app.run()
 
     if app.aborted:
         click.echo("Aborted.", err=True)
         return
 
-    git_root = subprocess.run(
-        ["git", "rev-parse", "--show-toplevel"],
-        capture_output=True, text=True, check=True,
-    ).stdout.strip()
-
+    invalidate_git_cache()
     if app.to_stage:
         subprocess.run(["git", "add", "--", *app.to_stage], check=True, cwd=git_root)
         click.echo(f"Staged {len(app.to_stage)} file(s):")
@@ -272,6 +332,7 @@ def cmd_add() -> None:
             create_branch(branch_name)
         full_msg = f"{ticket} {app.commit_message}"
         subprocess.run(["git", "commit", "--no-verify", "-m", full_msg], check=True)
+        invalidate_git_cache()
     elif not app.to_stage and not app.to_unstage:
         click.echo("No changes made.", err=True)
 
@@ -351,11 +412,9 @@ def cmd_fmt_delete(name: str) -> None:
 @cmd_fmt.command("diff")
 def cmd_fmt_diff() -> None:
     """Run formatters over all files changed between the current branch and the default branch."""
-    from rich.console import Console
     from .formatters import build_fmt_table
 
-    current = get_current_branch()
-    default_branch = get_default_branch()
+    current, default_branch = get_branch_context()
     if current in (None, default_branch, "main", "master"):
         click.echo(
             f"On {current or 'detached HEAD'} — nothing to format. "
@@ -383,15 +442,13 @@ def cmd_fmt_diff() -> None:
     if msg == "clean":
         click.echo("Nothing to format.")
         return
-    Console().print(table)
+    _console().print(table)
 
 
 @main.command("push")
 def cmd_push() -> None:
     """Push the current branch and open any linked open PR in the browser."""
-    from .tui.ticket_picker import ensure_ticket
-
-    ticket = ensure_ticket()
+    ticket = _ensure_ticket()
 
     result = subprocess.run(
         ["git", "push", "-u", "origin", "HEAD"],
@@ -406,14 +463,8 @@ def cmd_push() -> None:
     if get_config("open_on_push") != "true":
         return
 
-    push_url: str | None = None
-    for line in result.stderr.splitlines():
-        for word in line.split():
-            if word.startswith("https://") and "/pull/new/" in word:
-                push_url = word
-                break
-        if push_url:
-            break
+    m = _PULL_NEW_URL_RE.search(result.stderr)
+    push_url = m.group(0) if m else None
 
     current_branch = get_current_branch()
     try:
@@ -439,8 +490,7 @@ def cmd_push() -> None:
 @main.command("reset")
 def cmd_reset() -> None:
     """Switch to the main branch and pull latest from origin."""
-    default_branch = get_default_branch()
-    current_branch = get_current_branch()
+    current_branch, default_branch = get_branch_context()
     stashed = False
 
     if current_branch != default_branch:
@@ -471,9 +521,11 @@ def cmd_reset() -> None:
                     )
             else:
                 raise click.Abort()
+        invalidate_git_cache()
 
     click.echo(f"Pulling latest from origin/{default_branch}…")
     pull_result = subprocess.run(["git", "pull", "origin", default_branch])
+    invalidate_git_cache()
     if pull_result.returncode != 0:
         if stashed:
             click.echo(
@@ -488,6 +540,7 @@ def cmd_reset() -> None:
             pop = subprocess.run(
                 ["git", "stash", "pop"], capture_output=True, text=True
             )
+            invalidate_git_cache()
             if pop.returncode != 0:
                 click.echo(pop.stdout.strip(), err=True)
                 click.echo(
@@ -501,11 +554,10 @@ def cmd_reset() -> None:
 @main.command("sync")
 def cmd_sync() -> None:
     """Rebase the current branch onto the latest default branch from origin."""
-    current_branch = get_current_branch()
+    current_branch, default_branch = get_branch_context()
     if current_branch is None:
         raise click.ClickException("Not on a branch (detached HEAD).")
 
-    default_branch = get_default_branch()
     if current_branch == default_branch:
         raise click.ClickException(
             f"Already on {default_branch}. Use 'jg reset' to pull the latest."
@@ -513,11 +565,13 @@ def cmd_sync() -> None:
 
     click.echo(f"Fetching origin…")
     fetch = subprocess.run(["git", "fetch", "origin"], capture_output=True, text=True)
+    invalidate_git_cache()
     if fetch.returncode != 0:
         raise click.ClickException(f"Fetch failed:\n{fetch.stderr.strip()}")
 
     click.echo(f"Rebasing {current_branch} onto origin/{default_branch}…")
     rebase = subprocess.run(["git", "rebase", f"origin/{default_branch}"])
+    invalidate_git_cache()
     if rebase.returncode != 0:
         click.echo(
             "\nRebase conflict detected. Resolve the conflicts then run:\n"
@@ -534,38 +588,39 @@ def cmd_sync() -> None:
 @main.command("prune")
 def cmd_prune() -> None:
     """Interactively prune local branches with no remote."""
-    from .tui.prune import PruneApp
-
-    click.echo("Fetching and pruning remote refs…")
-    fetch = subprocess.run(["git", "fetch", "--prune"], capture_output=True, text=True)
-    if fetch.returncode != 0:
-        raise click.ClickException(f"Fetch failed:\n{fetch.stderr.strip()}")
-
-    result = subprocess.run(["git", "branch", "-vv"], capture_output=True, text=True, check=True)
+    import tempfile
 
-    current = get_current_branch()
-    default_branch = get_default_branch()
+    from .tui.prune import PruneApp, read_fetch_log
 
-    branches: list[dict] = []
-    for line in result.stdout.splitlines():
-        parts = line.lstrip("* ").split()
-        if not parts:
-            continue
-        branch = parts[0]
-        if branch in (current, default_branch):
-            continue
-        if ": gone]" in line:
-            branches.append({"name": branch, "status": "remote deleted"})
-        elif "[origin/" not in line:
-            branches.append({"name": branch, "status": "never pushed"})
+    # The fetch runs while the picker shows the local state; PruneApp refreshes
+    # the list when it lands. stderr goes to a file rather than a pipe so that
+    # only Popen.wait() (which is thread-safe) is ever called on the process —
+    # PruneApp's worker and this function may both be waiting on it.
+    fetch_log = tempfile.TemporaryFile()
+    fetch = subprocess.Popen(
+        ["git", "fetch", "--prune"], stdout=subprocess.DEVNULL, stderr=fetch_log,
+    )
+    branches = get_prunable_branches()
 
     if not branches:
-        click.echo("No prunable local branches found.")
-        return
+        click.echo("Fetching and pruning remote refs…")
+        fetch.wait()
+        invalidate_git_cache()
+        if fetch.returncode != 0:
+            raise click.ClickException(f"Fetch failed:\n{read_fetch_log(fetch_log)}")
+        branches = get_prunable_branches()
+        if not branches:
+            click.echo("No prunable local branches found.")
+            return
 
-    app = PruneApp(branches)
+    running = fetch.poll() is None
+    app = PruneApp(branches, fetch=fetch if running else None, fetch_log=fetch_log)
     app.run()
 
+    if fetch.poll() is None:
+        click.echo("Waiting for git fetch to finish…", err=True)
+        fetch.wait()
+
     if app.deleted:
         click.echo(f"Deleted {len(app.deleted)} branch(es): {', '.join(app.deleted)}")
 
@@ -585,54 +640,61 @@ def cmd_commit(message: str, git_args: tuple[str, ...]) -> None:
         sys.exit(1)
     commit_msg = f"{ticket} {message}"
     subprocess.run(["git", "commit", "-m", commit_msg, *git_args], check=True)
+    invalidate_git_cache()
 
 
 @main.command("debug")
 @click.argument("ticket")
-def cmd_debug(ticket: str) -> None:
+@click.option(
+    "--fields", default=None,
+    help="Comma-separated fields to fetch, e.g. summary,status or *all,-comment,-worklog to skip the heaviest ones",
+)
+@click.option("--fresh", is_flag=True, help="Bypass the short-lived on-disk issue cache")
+def cmd_debug(ticket: str, fields: str | None, fresh: bool) -> None:
     """Dump every raw JIRA field for a ticket — useful for inspecting API shape."""
-    from rich.console import Console
-    from rich.syntax import Syntax
+    import requests
 
-    jira = get_jira_client()
     try:
-        issue = jira.issue(ticket)
-    except JIRAError as e:
-        raise click.ClickException(f"JIRA API error: {e.text}") from e
+        data = get_issue_raw(ticket, fields, use_cache=not fresh)
+    except requests.HTTPError as e:
+        raise click.ClickException(f"JIRA API error: {_http_error_text(e)}") from e
 
-    console = Console()
-    console.print(f"\n[bold #00e5ff]{issue.key}[/]  [#b8d4b8]{issue.fields.summary}[/]\n")
+    # Rendering imports only once there is something to render
+    from rich.syntax import Syntax
+
+    raw = data.get("fields", {})
+    console = _console()
+    console.print(f"\n[bold #00e5ff]{data['key']}[/]  [#b8d4b8]{raw.get('summary', '')}[/]\n")
 
-    raw = issue.raw.get("fields", {})
     filtered = {k: v for k, v in raw.items() if v not in (None, [], "", {})}
-    console.print(Syntax(json.dumps(filtered, indent=2, default=str), "json", theme="monokai"))
+    console.print(Syntax(_json_dumps_pretty(filtered), "json", theme="monokai"))
 
 
 @main.command("info")
 @click.argument("ticket", required=False)
-def cmd_info(ticket: str | None) -> None:
+@click.option("--fresh", is_flag=True, help="Bypass the short-lived on-disk issue cache")
+def cmd_info(ticket: str | None, fresh: bool) -> None:
     """Show details for the current (or given) ticket."""
-    from rich.console import Console
-    from rich.panel import Panel
-
-    from .tui.theme import build_ticket_info
-
     key = ticket or get_ticket()
     if not key:
         click.echo("No ticket set. Use 'jg set TICKET-123' first.", err=True)
         sys.exit(1)
 
-    jira = get_jira_client()
+    import requests
+
     try:
-        issue = jira.issue(
-            key,
-            fields=["summary", "status", "assignee", "reporter", "priority", "labels", "description", "issuetype"],
-        )
-    except JIRAError as e:
-        raise click.ClickException(f"JIRA API error: {e.text}") from e
+        data = get_issue_raw(key, ",".join(TICKET_INFO_FIELDS), use_cache=not fresh)
+    except requests.HTTPError as e:
+        raise click.ClickException(f"JIRA API error: {_http_error_text(e)}") from e
 
-    content = build_ticket_info(issue, get_jira_server())
-    Console().print(Panel(content, title=f"[bold bright_blue]{issue.key}[/bold bright_blue]", border_style="bright_blue", padding=(1, 2)))
+    # Rendering imports (tui.theme pulls in textual too) only once there is
+    # something to render
+    from rich.panel import Panel
+
+    from .tui.theme import build_ticket_info_raw
+
+    content = build_ticket_info_raw(data, get_jira_server())
+    _console().print(Panel(content, title=f"[bold bright_blue]{data['key']}[/bold bright_blue]", border_style="bright_blue", padding=(1, 2)))
 
 
 @main.command("open")
@@ -652,10 +714,12 @@ def cmd_open(ticket: str | None) -> None:
 @click.argument("ticket", required=False)
 def cmd_prs(ticket: str | None) -> None:
     """Browse PRs linked to the current (or given) ticket."""
+    import requests
+    from jira import JIRAError
+
     from .tui.pr_picker import PrPickerApp
-    from .tui.ticket_picker import ensure_ticket
 
-    key = ticket or ensure_ticket()
+    key = ticket or _ensure_ticket()
 
     jira = get_jira_client()
     try:
@@ -684,12 +748,13 @@ def cmd_prs(ticket: str | None) -> None:
 
     _src = {"github": 0, "jira": 1}
     _sts = {"OPEN": 0, "MERGED": 1, "DECLINED": 2}
-    # Sort by lastUpdate desc first (stable sort preserves this within groups)
-    sorted_prs = sorted(prs, key=lambda p: p.get("lastUpdate", ""), reverse=True)
-    sorted_prs.sort(key=lambda p: (
-        _src.get(p.get("_source", "jira"), 9),
-        _sts.get(p.get("status", ""), 9),
-    ))
+    # Sort by lastUpdate desc, then bucket by (source, status) in one pass —
+    # appending in that order keeps each group newest-first without a second sort
+    groups: dict[tuple[int, int], list[dict]] = {}
+    for pr in sorted(prs, key=lambda p: p.get("lastUpdate", ""), reverse=True):
+        group = (_src.get(pr.get("_source", "jira"), 9), _sts.get(pr.get("status", ""), 9))
+        groups.setdefault(group, []).append(pr)
+    sorted_prs = [pr for group in sorted(groups) for pr in groups[group]]
     app = PrPickerApp(sorted_prs, open_on_enter=True)
     app.run()
 
@@ -735,7 +800,7 @@ def config_list() -> None:
         ("fmt_on_add",    "Run formatters automatically before commit in jg add (true/false)"),
         ("open_on_push",  "Open PR in browser after jg push (true/false)"),
     ]
-    config = _read_config()
+    config = _load_config()  # read-only here, so no copy
     for key, description, secret in known:
         value = config.get(key)
         if value:
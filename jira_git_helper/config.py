@@ -1,14 +1,27 @@
 from __future__ import annotations
 
+import fnmatch
 import json
 import os
 import re
+from collections.abc import Callable
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional speedup — stdlib json is used when orjson is absent
+    orjson = None
+
 # --- paths ---
 
 STATE_FILE = Path.home() / ".local" / "share" / "jira-git-helper" / "ticket"
 CONFIG_FILE = Path.home() / ".config" / "jira-git-helper" / "config"
+CACHE_DIR = Path.home() / ".cache" / "jira-git-helper"
+
+# Shape of a ticket key (PROJ-123) and of a bare project key
+_TICKET_RE = re.compile(r"^([A-Za-z][A-Za-z0-9]*)-\d+$")
+_PROJECT_KEY_RE = re.compile(r"[A-Za-z][A-Za-z0-9]*\Z")
 
 # Generic JQL used when none is set in config
 _FALLBACK_JQL = "assignee = currentUser() ORDER BY updated DESC"
@@ -18,6 +31,37 @@ _FALLBACK_JQL = "assignee = currentUser() ORDER BY updated DESC"
 # Key absent → fall back to config default.
 _session_active_filters: dict[str, str | None] = {}
 
+# STATE_FILE contents, keyed by its (mtime_ns, size) — see get_ticket().
+_ticket_cache: tuple[tuple[int, int], str | None] | None = None
+
+# Parsed CONFIG_FILE, keyed by its (mtime_ns, size) so repeated reads within a
+# process skip the file I/O and parse. Refreshed by _write_config().
+_config_cache: tuple[tuple[int, int], dict[str, str]] | None = None
+
+# --- JSON helpers (config blobs) ---
+
+if orjson is not None:
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+    def _json_dumps_pretty(obj) -> str:
+        """Indented JSON for display; unknown types are rendered with str()."""
+        try:
+            return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2).decode()
+        except orjson.JSONEncodeError:  # e.g. ints beyond 64 bits
+            return json.dumps(obj, indent=2, default=str)
+else:
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> str:
+        return json.dumps(obj, separators=(",", ":"))
+
+    def _json_dumps_pretty(obj) -> str:
+        """Indented JSON for display; unknown types are rendered with str()."""
+        return json.dumps(obj, indent=2, default=str)
+
 # --- state helpers ---
 
 
@@ -29,34 +73,46 @@ def get_ticket() -> str | None:
     if env is not None:
         return env.strip() or None
     # No hook — fall back to the persisted file (single-shell / no-hook setups).
-    if STATE_FILE.exists():
-        return STATE_FILE.read_text().strip() or None
-    return None
+    # Re-read it only when its stat changes; another shell may have written it.
+    global _ticket_cache
+    try:
+        st = STATE_FILE.stat()
+    except FileNotFoundError:
+        _ticket_cache = None
+        return None
+    stamp = (st.st_mtime_ns, st.st_size)
+    if _ticket_cache is None or _ticket_cache[0] != stamp:
+        _ticket_cache = (stamp, STATE_FILE.read_text().strip() or None)
+    return _ticket_cache[1]
 
 
 def validate_ticket_project(ticket: str) -> None:
     """Raise ValueError if *ticket* doesn't match a configured project."""
-    projects = get_projects()
+    raw = get_config("projects") or ""
+    projects = _projects(raw)
     if not projects:
         return  # no projects configured — allow anything
-    m = re.match(r"^([A-Za-z][A-Za-z0-9]*)-\d+$", ticket)
-    if not m:
+    if _project_ticket_re(raw).match(ticket):
+        return
+    if not _TICKET_RE.match(ticket):
         raise ValueError(f"Invalid ticket format: {ticket}")
-    prefix = m.group(1).upper()
-    if prefix not in (p.upper() for p in projects):
-        allowed = ", ".join(projects)
-        raise ValueError(
-            f"Ticket {ticket} does not match configured projects ({allowed})"
-        )
+    allowed = ", ".join(projects)
+    raise ValueError(
+        f"Ticket {ticket} does not match configured projects ({allowed})"
+    )
 
 
 def save_ticket(ticket: str) -> None:
+    global _ticket_cache
     validate_ticket_project(ticket)
+    _ticket_cache = None
     STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
     STATE_FILE.write_text(ticket)
 
 
 def clear_ticket() -> None:
+    global _ticket_cache
+    _ticket_cache = None
     if STATE_FILE.exists():
         STATE_FILE.unlink()
 
@@ -64,59 +120,116 @@ def clear_ticket() -> None:
 # --- config helpers ---
 
 
-def _read_config() -> dict[str, str]:
-    if not CONFIG_FILE.exists():
+def _config_stamp() -> tuple[int, int] | None:
+    try:
+        st = CONFIG_FILE.stat()
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _load_config() -> dict[str, str]:
+    """Return the parsed config, re-reading CONFIG_FILE only when it has changed.
+
+    The returned dict is shared — callers must not mutate it (use _read_config()).
+    """
+    global _config_cache
+    stamp = _config_stamp()
+    if stamp is None:
+        _config_cache = None
         return {}
+    if _config_cache is not None and _config_cache[0] == stamp:
+        return _config_cache[1]
     config: dict[str, str] = {}
-    for line in CONFIG_FILE.read_text().splitlines():
+    # Parse bytes and decode only the key/value fragments — one pass over the file.
+    for line in CONFIG_FILE.read_bytes().split(b"\n"):
         line = line.strip()
-        if "=" in line and not line.startswith("#"):
-            key, _, value = line.partition("=")
-            config[key.strip()] = value.strip()
+        if not line or line[:1] == b"#":
+            continue
+        key, sep, value = line.partition(b"=")
+        if sep:
+            config[key.strip().decode()] = value.strip().decode()
+    _config_cache = (stamp, config)
+    _clear_config_memos()
     return config
 
 
+def _read_config() -> dict[str, str]:
+    return dict(_load_config())
+
+
 def _write_config(config: dict[str, str]) -> None:
+    global _config_cache
     CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
+    # UTF-8 regardless of locale — _load_config() decodes it as UTF-8, and
+    # _json_dumps (orjson) writes non-ASCII filter names/JQL unescaped
     CONFIG_FILE.write_text(
-        "\n".join(f"{k}={v}" for k, v in sorted(config.items())) + "\n"
+        "\n".join(f"{k}={v}" for k, v in sorted(config.items())) + "\n",
+        encoding="utf-8",
     )
+    _config_cache = (_config_stamp(), dict(config))
+    _clear_config_memos()
 
 
 def get_config(key: str) -> str | None:
-    return _read_config().get(key)
+    return _load_config().get(key)
 
 
 def set_config(key: str, value: str) -> None:
-    config = _read_config()
-    config[key] = value
+    set_config_many({key: value})
+
+
+def set_config_many(updates: dict[str, str | None]) -> None:
+    """Apply several config changes with a single write. A None value removes the key.
+
+    Skips the write entirely when nothing would change.
+    """
+    current = _load_config()
+    if all(current.get(k) == v for k, v in updates.items()):
+        return
+    config = dict(current)
+    for key, value in updates.items():
+        if value is None:
+            config.pop(key, None)
+        else:
+            config[key] = value
     _write_config(config)
 
 
 def get_projects() -> list[str]:
     """Return the list of configured project keys (from the comma-separated 'projects' config)."""
-    raw = get_config("projects") or ""
-    return [p.strip().upper() for p in raw.split(",") if p.strip()]
+    return list(_projects(get_config("projects") or ""))
 
 
 def get_fields_for_project(project: str) -> list[str]:
     """Return extra field IDs configured for a project via fields.<PROJECT> config key."""
-    raw = get_config(f"fields.{project}") or ""
-    return [f.strip() for f in raw.split(",") if f.strip()]
+    return list(_split_fields(get_config(f"fields.{project}") or ""))
 
 
 def get_filters_for_project(project: str) -> list[dict]:
     """Return saved named filters for a project as a list of {name, jql} dicts."""
-    raw = get_config(f"filters.{project}") or "[]"
-    try:
-        return json.loads(raw)
-    except (json.JSONDecodeError, ValueError):
-        return []
+    _load_config()  # drops memos if the file changed on disk
+    return [dict(f) for f in _filters_for_project(project)]
 
 
 def set_filters_for_project(project: str, filters: list[dict]) -> None:
-    """Persist the named filter list for a project."""
-    set_config(f"filters.{project}", json.dumps(filters, separators=(",", ":")))
+    """Persist the named filter list for a project.
+
+    A persisted default that no longer names a filter is cleared in the same write.
+    """
+    updates: dict[str, str | None] = {f"filters.{project}": _json_dumps(filters)}
+    default = get_active_filter_name(project)
+    if default and not any(f["name"] == default for f in filters):
+        updates[f"filters.{project}.default"] = None
+    set_config_many(updates)
+
+
+def set_filters_and_default(project: str, filters: list[dict] | None, default: str | None) -> None:
+    """Persist a project's default filter name, and its filter list unless None, in one write."""
+    updates: dict[str, str | None] = {f"filters.{project}.default": default or None}
+    if filters is not None:
+        updates[f"filters.{project}"] = _json_dumps(filters)
+    set_config_many(updates)
 
 
 def get_active_filter_name(project: str) -> str | None:
@@ -126,27 +239,31 @@ def get_active_filter_name(project: str) -> str | None:
 
 def set_active_filter_name(project: str, name: str | None) -> None:
     """Set (or clear) the persisted default filter name for a project."""
-    config = _read_config()
-    key = f"filters.{project}.default"
-    if name:
-        config[key] = name
-    else:
-        config.pop(key, None)
-    _write_config(config)
+    set_config_many({f"filters.{project}.default": name or None})
 
 
 def get_formatters() -> list[dict]:
     """Return all configured formatters as a list of {name, glob, cmd} dicts."""
     raw = get_config("fmt") or "[]"
     try:
-        return json.loads(raw)
-    except (json.JSONDecodeError, ValueError):
+        return _json_loads(raw)
+    except ValueError:
         return []
 
 
+def get_compiled_formatters() -> list[tuple[str, Callable[[str], object], str]]:
+    """Return formatters as (name, matcher, cmd) tuples, in config order.
+
+    Match a file with ``matcher(os.path.normcase(basename))`` — truthy exactly
+    when fnmatch.fnmatch(basename, glob) would be, without re-translating the glob.
+    """
+    _load_config()  # drops memos if the file changed on disk
+    return list(_compiled_formatters())
+
+
 def set_formatters(formatters: list[dict]) -> None:
     """Persist the formatter list."""
-    set_config("fmt", json.dumps(formatters, separators=(",", ":")))
+    set_config("fmt", _json_dumps(formatters))
 
 
 def get_effective_filter_name(project: str) -> str | None:
@@ -164,9 +281,80 @@ def get_jql_for_project(project: str) -> str:
       2. Persisted default filter (set via Space in the filter picker)
       3. Built-in default: project = PROJECT AND assignee = currentUser() ORDER BY updated DESC
     """
-    active_name = get_effective_filter_name(project)
+    _load_config()  # drops memos if the file changed on disk
+    return _jql_for(project, get_effective_filter_name(project))
+
+
+# --- memoized config-derived values ---
+#
+# Cleared whenever _load_config() re-parses CONFIG_FILE or _write_config() runs,
+# so they never outlive the config they were derived from. Return immutable
+# values only; public getters copy before handing them out.
+
+
+@lru_cache(maxsize=32)
+def _projects(raw: str) -> tuple[str, ...]:
+    return tuple(p.strip().upper() for p in raw.split(",") if p.strip())
+
+
+@lru_cache(maxsize=32)
+def _project_ticket_re(raw: str) -> re.Pattern:
+    """One case-insensitive alternation matching a ticket key in any configured project."""
+    keys = [p for p in _projects(raw) if _PROJECT_KEY_RE.match(p)]
+    alternation = "|".join(map(re.escape, keys)) or "(?!)"
+    return re.compile(rf"^(?ai:{alternation})-\d+$")
+
+
+@lru_cache(maxsize=32)
+def _split_fields(raw: str) -> tuple[str, ...]:
+    return tuple(f.strip() for f in raw.split(",") if f.strip())
+
+
+@lru_cache(maxsize=None)
+def _filters_for_project(project: str) -> tuple[dict, ...]:
+    raw = get_config(f"filters.{project}") or "[]"
+    try:
+        return tuple(_json_loads(raw))
+    except ValueError:
+        return ()
+
+
+@lru_cache(maxsize=None)
+def _filters_index(project: str) -> dict[str, str]:
+    """Map filter name → JQL for a project (first entry wins on duplicate names)."""
+    index: dict[str, str] = {}
+    for f in _filters_for_project(project):
+        index.setdefault(f["name"], f["jql"])
+    return index
+
+
+@lru_cache(maxsize=None)
+def _jql_for(project: str, active_name: str | None) -> str:
     if active_name:
-        for f in get_filters_for_project(project):
-            if f["name"] == active_name:
-                return f["jql"]
+        jql = _filters_index(project).get(active_name)
+        if jql is not None:
+            return jql
     return f"project = {project} AND assignee = currentUser() ORDER BY updated DESC"
+
+
+def _glob_matcher(glob: str) -> Callable[[str], object]:
+    """Return a predicate for *glob*; plain ``*.ext`` globs become a suffix check."""
+    glob = os.path.normcase(glob)
+    suffix = glob[1:]
+    if glob[:1] == "*" and not any(c in suffix for c in "*?["):
+        return lambda name: name.endswith(suffix)
+    return re.compile(fnmatch.translate(glob)).match
+
+
+@lru_cache(maxsize=None)
+def _compiled_formatters() -> tuple[tuple[str, Callable[[str], object], str], ...]:
+    formatters = get_formatters()
+    matchers = {glob: _glob_matcher(glob) for glob in {f["glob"] for f in formatters}}
+    return tuple((f["name"], matchers[f["glob"]], f["cmd"]) for f in formatters)
+
+
+def _clear_config_memos() -> None:
+    _compiled_formatters.cache_clear()
+    _filters_for_project.cache_clear()
+    _filters_index.cache_clear()
+    _jql_for.cache_clear()
@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
-import fnmatch
 import os
+import re
 import subprocess
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from functools import partial
 
 import click
 
-from .config import get_formatters
-from .git import get_file_statuses
+from .config import get_compiled_formatters
+from .git import get_file_statuses, get_git_root, invalidate_status_cache
 
 FILE_STATUS_LABELS: dict[str, str] = {
     "M": "modified",
@@ -20,50 +24,108 @@ FILE_STATUS_LABELS: dict[str, str] = {
     "C": "copied",
 }
 
+# Recent get_binary_paths() results: (git_root, frozenset(paths)) → (fetched_at, binary).
+# Lets a format → reload → format sequence in one session skip the repeat ls-files.
+_BINARY_CACHE: OrderedDict[tuple[str, frozenset[str]], tuple[float, frozenset[str]]] = OrderedDict()
+_BINARY_CACHE_SIZE = 8
+_BINARY_CACHE_TTL = 5.0
+
+# One `git ls-files --eol -z` record whose worktree side is binary:
+# "i/<eol> w/-text attr/<attrs>\t<path>\0" (columns space-padded, tab before path)
+_BINARY_EOL_RE = re.compile(rb"w/-text +attr/[^\t]*\t([^\0]*)\0")
+
+# Bytes read per step when scanning back over a file's trailing newlines
+_EOF_BLOCK = 4096
+
 
 def get_binary_paths(paths: list[str], git_root: str) -> set[str]:
     """Return the subset of paths that git identifies as binary (w/-text) via git ls-files --eol."""
     if not paths:
         return set()
+    key = (git_root, frozenset(paths))
+    hit = _BINARY_CACHE.get(key)
+    if hit is not None and time.monotonic() - hit[0] < _BINARY_CACHE_TTL:
+        _BINARY_CACHE.move_to_end(key)
+        return set(hit[1])
     result = subprocess.run(
-        ["git", "ls-files", "--eol", "--", *paths],
-        capture_output=True, text=True, cwd=git_root,
+        ["git", "ls-files", "--eol", "-z", "--", *paths],
+        capture_output=True, cwd=git_root,
     )
-    binary: set[str] = set()
-    for line in result.stdout.splitlines():
-        # Format: "i/<eol>\tw/<eol>\tattr/<attrs>\t<path>"
-        # Use split(None, 3) to handle varying whitespace between columns.
-        parts = line.split(None, 3)
-        if len(parts) < 4:
-            continue
-        w_eol = parts[1]  # e.g. "w/lf", "w/-text", "w/crlf"
-        path = parts[3]
-        if w_eol == "w/-text":
-            binary.add(path)
+    binary = {
+        path.decode("utf-8", "surrogateescape")
+        for path in _BINARY_EOL_RE.findall(result.stdout)
+    }
+    _BINARY_CACHE[key] = (time.monotonic(), frozenset(binary))
+    _BINARY_CACHE.move_to_end(key)
+    while len(_BINARY_CACHE) > _BINARY_CACHE_SIZE:
+        _BINARY_CACHE.popitem(last=False)
     return binary
 
 
 def fix_eof(abs_path: str) -> tuple[bool, str]:
-    """Ensure file ends with exactly one newline. Returns (ok, error_msg)."""
+    """Ensure file ends with exactly one newline. Returns (ok, error_msg).
+
+    Only the tail of the file is read; a file that already ends correctly is
+    never rewritten, and a fix truncates trailing CR/LF bytes in place.
+    """
     try:
         with open(abs_path, "rb") as f:
-            content = f.read()
-        if not content:
+            size = f.seek(0, os.SEEK_END)
+            if not size:
+                return True, ""
+            f.seek(max(0, size - 2))
+            tail = f.read()
+        if tail[-1:] == b"\n" and (size == 1 or tail[-2:-1] not in (b"\r", b"\n")):
             return True, ""
-        fixed = content.rstrip(b"\r\n") + b"\n"
-        if fixed != content:
-            with open(abs_path, "wb") as f:
-                f.write(fixed)
+        with open(abs_path, "r+b") as f:
+            # Walk back over the trailing CR/LF run a block at a time.
+            end = size
+            while end > 0:
+                start = max(0, end - _EOF_BLOCK)
+                f.seek(start)
+                block = f.read(end - start)
+                stripped = block.rstrip(b"\r\n")
+                end = start + len(stripped)
+                if stripped:
+                    break
+            f.seek(end)
+            f.write(b"\n")
+            f.truncate()
         return True, ""
     except OSError as e:
         return False, str(e)
 
 
-def build_fmt_table(paths: list[str] | None = None) -> "tuple[str, object]":
+def _format_file(
+    abs_path: str, user_formatters: list[tuple[str, Callable[[str], object], str]]
+) -> list[tuple[str, int, str]]:
+    """Run eof and every matching user formatter over one file, in order.
+
+    Returns (formatter name, exit code, error message) per formatter run.
+    """
+    # Built-in eof formatter — runs on every text file
+    ok, err = fix_eof(abs_path)
+    results = [("eof", 0 if ok else 1, err)]
+
+    # User-configured formatters
+    match_name = os.path.normcase(os.path.basename(abs_path))
+    for name, matches, cmd_template in user_formatters:
+        if matches(match_name):
+            cmd = cmd_template.replace("{}", abs_path)
+            result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+            error_msg = "" if result.returncode == 0 else (result.stderr or result.stdout or "").strip()
+            results.append((name, result.returncode, error_msg))
+    return results
+
+
+def build_fmt_table(
+    paths: list[str] | None = None, git_root: str | None = None
+) -> "tuple[str, object]":
     """Run all formatters and return (message | None, table | None).
 
     If *paths* is given, format exactly those files. Otherwise, format all
-    staged, modified, and untracked files from git status.
+    staged, modified, and untracked files from git status. *git_root* defaults
+    to get_git_root().
 
     Returns ("clean", None) if there are no files to format.
     Otherwise returns (None, rich.table.Table) with all results.
@@ -71,7 +133,7 @@ def build_fmt_table(paths: list[str] | None = None) -> "tuple[str, object]":
     from rich.table import Table
     from rich.text import Text
 
-    user_formatters = get_formatters()
+    user_formatters = get_compiled_formatters()
 
     if paths is not None:
         all_paths = paths
@@ -87,11 +149,11 @@ def build_fmt_table(paths: list[str] | None = None) -> "tuple[str, object]":
     if not all_paths:
         return "clean", None
 
-    git_root = subprocess.run(
-        ["git", "rev-parse", "--show-toplevel"],
-        capture_output=True, text=True, check=True,
-    ).stdout.strip()
+    if git_root is None:
+        git_root = get_git_root()
 
+    # Every candidate is checked: the eof fixer runs on all non-binary files,
+    # whatever their extension or formatter globs say.
     binary_paths = get_binary_paths(all_paths, git_root)
 
     table = Table(show_header=True, header_style="bold", box=None, padding=(0, 1))
@@ -101,50 +163,41 @@ def build_fmt_table(paths: list[str] | None = None) -> "tuple[str, object]":
     table.add_column("Exit", no_wrap=True)
     table.add_column("Note", style="red")
 
-    for path in sorted(all_paths):
-        abs_path = os.path.join(git_root, path)
-        basename = os.path.basename(path)
+    text_paths = [p for p in all_paths if p not in binary_paths]
+    abs_paths = [os.path.join(git_root, p) for p in text_paths]
+    run_file = partial(_format_file, user_formatters=user_formatters)
 
+    # Files are independent, so format them concurrently; each file's own
+    # formatters still run in order since they rewrite the same file.
+    if len(abs_paths) > 1:
+        from concurrent.futures import ThreadPoolExecutor  # deferred: pulls in logging
+
+        workers = min(32, (os.cpu_count() or 4) * 2, len(abs_paths))
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            results = dict(zip(text_paths, ex.map(run_file, abs_paths)))
+    else:
+        results = dict(zip(text_paths, map(run_file, abs_paths)))
+
+    # Shared cells — Table never mutates a Text it renders, so one instance can
+    # appear in every row.
+    ok_mark = Text("✓", style="bold green")
+    bad_mark = Text("✗", style="bold red")
+    dash = Text("—", style="dim")
+    skipped = Text("skipped (binary)", style="dim")
+    exit_cells: dict[int, Text] = {0: Text("0", style="green")}
+
+    for path in sorted(all_paths):
         if path in binary_paths:
-            table.add_row(
-                Text("—", style="dim"),
-                Text(path, style="dim"),
-                Text("—", style="dim"),
-                Text("—", style="dim"),
-                Text("skipped (binary)", style="dim"),
-            )
+            table.add_row(dash, Text(path, style="dim"), dash, dash, skipped)
             continue
 
-        # Built-in eof formatter — runs on every text file
-        ok, err = fix_eof(abs_path)
-        if ok:
-            table.add_row(Text("✓", style="bold green"), path, "eof", Text("0", style="green"), "")
-        else:
-            table.add_row(Text("✗", style="bold red"), path, "eof", Text("1", style="red"), err)
-
-        # User-configured formatters
-        for fmt in user_formatters:
-            if fnmatch.fnmatch(basename, fmt["glob"]):
-                cmd = fmt["cmd"].replace("{}", abs_path)
-                result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-                if result.returncode == 0:
-                    table.add_row(
-                        Text("✓", style="bold green"),
-                        path,
-                        fmt["name"],
-                        Text("0", style="green"),
-                        "",
-                    )
-                else:
-                    error_msg = (result.stderr or result.stdout or "").strip()
-                    table.add_row(
-                        Text("✗", style="bold red"),
-                        path,
-                        fmt["name"],
-                        Text(str(result.returncode), style="red"),
-                        error_msg,
-                    )
+        for name, code, error_msg in results[path]:
+            exit_cell = exit_cells.get(code)
+            if exit_cell is None:
+                exit_cell = exit_cells[code] = Text(str(code), style="red")
+            table.add_row(ok_mark if code == 0 else bad_mark, path, name, exit_cell, error_msg)
 
+    invalidate_status_cache()  # formatters rewrite files in place
     return None, table
 
 
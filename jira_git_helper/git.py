@@ -1,44 +1,213 @@
 """Git helper utilities for jira-git-helper."""
 
+import shutil
 import subprocess
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
 
 import click
 
+# Clipboard tools in preference order
+_CLIPBOARD_TOOLS: list[list[str]] = [
+    ["pbcopy"],
+    ["wl-copy"],
+    ["xclip", "-selection", "clipboard"],
+]
+# Those found on PATH, resolved on first copy by _resolve_clipboard_cmds()
+_clipboard_cmds: list[list[str]] | None = None
+
+# Last `git status` result: (key, fetched_at, statuses). The key is the repo's
+# index mtime + HEAD contents; the short TTL covers worktree edits, which touch
+# neither. Dropped by invalidate_status_cache() after we stage/commit/format.
+_STATUS_CACHE_TTL = 2.0
+_status_cache: tuple[tuple, float, tuple] | None = None
+_status_lock = threading.Lock()
+
+# get_branch_context() result, keyed on the repo's .git/HEAD mtime
+_branch_context_cache: tuple[tuple[str, int], tuple[str | None, str]] | None = None
+
+# get_current_branch() result, keyed like _branch_context_cache
+_current_branch_cache: tuple[tuple[str, int], str | None] | None = None
+
+# Default branch per .git directory — origin/HEAD doesn't move during a command
+_default_branch_cache: dict[str, str] = {}
+
+
+def run_git_batch(cmds: list[list[str]]) -> list[subprocess.CompletedProcess]:
+    """Run independent commands concurrently, returning their results in order.
+
+    Each command is run with ``capture_output=True, text=True``; wall time is that
+    of the slowest command rather than the sum of all of them.
+    """
+    if len(cmds) <= 1:
+        return [subprocess.run(cmd, capture_output=True, text=True) for cmd in cmds]
+    from concurrent.futures import ThreadPoolExecutor  # deferred: pulls in logging
+
+    with ThreadPoolExecutor(max_workers=min(4, len(cmds))) as pool:
+        return list(pool.map(
+            lambda cmd: subprocess.run(cmd, capture_output=True, text=True), cmds,
+        ))
+
+
+def _find_git_dir() -> Path | None:
+    """Return the .git directory above the cwd, or None (not a repo, or a worktree file)."""
+    cwd = Path.cwd()
+    for parent in (cwd, *cwd.parents):
+        candidate = parent / ".git"
+        if candidate.is_dir():
+            return candidate
+        if candidate.exists():
+            return None
+    return None
+
+
+@lru_cache(maxsize=None)
+def get_git_root() -> str:
+    """Return the repository's top-level directory (`git rev-parse --show-toplevel`).
+
+    Resolved once per process — the CLI never changes directory. Raises
+    CalledProcessError outside a repository.
+    """
+    return subprocess.run(
+        ["git", "rev-parse", "--show-toplevel"],
+        capture_output=True, text=True, check=True,
+    ).stdout.strip()
+
+
+def _status_cache_key() -> tuple | None:
+    git_dir = _find_git_dir()
+    if git_dir is None:
+        return None
+    try:
+        index_mtime = (git_dir / "index").stat().st_mtime_ns
+    except FileNotFoundError:
+        index_mtime = 0
+    try:
+        head = (git_dir / "HEAD").read_bytes()
+    except OSError:
+        return None
+    return str(git_dir), index_mtime, head
+
+
+def invalidate_status_cache() -> None:
+    """Forget the cached `git status` so the next get_file_statuses() re-runs it."""
+    global _status_cache
+    _status_cache = None
+
+
+def invalidate_git_cache() -> None:
+    """Forget every memoized git read (status, current branch, branch context).
+
+    Call after running a git command that can move HEAD, touch refs or change
+    the index — switch, stash, pull, rebase, fetch, commit, branch -D.
+    """
+    global _branch_context_cache, _current_branch_cache
+    _branch_context_cache = None
+    _current_branch_cache = None
+    invalidate_status_cache()
+
+
+def _head_key() -> tuple[str, int] | None:
+    """Return (git dir, .git/HEAD mtime) — changes whenever HEAD is rewritten."""
+    git_dir = _find_git_dir()
+    if git_dir is None:
+        return None
+    try:
+        return str(git_dir), (git_dir / "HEAD").stat().st_mtime_ns
+    except OSError:
+        return None
+
 
 def get_file_statuses() -> tuple[list[tuple[str, str]], list[tuple[str, str]], list[tuple[str, str]], list[tuple[str, str]]]:
-    """Return (staged, modified, deleted, untracked) as lists of (status_code, filepath)."""
-    result = subprocess.run(["git", "status", "--porcelain"], capture_output=True, text=True)
+    """Return (staged, modified, deleted, untracked) as lists of (status_code, filepath).
+
+    Repeated calls within a couple of seconds on an unchanged index/HEAD reuse the
+    previous result; concurrent callers share a single `git status` run.
+    """
+    global _status_cache
+    with _status_lock:
+        key = _status_cache_key()
+        cached = _status_cache
+        if (
+            key is not None and cached is not None and cached[0] == key
+            and time.monotonic() - cached[1] < _STATUS_CACHE_TTL
+        ):
+            return tuple(list(group) for group in cached[2])
+        statuses = _run_git_status()
+        if key is not None:
+            _status_cache = (key, time.monotonic(), tuple(tuple(group) for group in statuses))
+        return statuses
+
+
+@lru_cache(maxsize=None)
+def _status_routes(xy: bytes) -> tuple[tuple[int, str], ...]:
+    """Map a porcelain XY pair to (bucket, status_code) entries.
+
+    Buckets index (staged, modified, deleted, untracked).
+    """
+    x, y = chr(xy[0]), chr(xy[1])
+    if x == "?" and y == "?":
+        return ((3, "?"),)
+    routes = []
+    if x not in (" ", "?"):
+        routes.append((0, x))
+    if y not in (" ", "?"):
+        routes.append((2, "D") if y == "D" else (1, y))
+    return tuple(routes)
+
+
+def _run_git_status() -> tuple[list[tuple[str, str]], list[tuple[str, str]], list[tuple[str, str]], list[tuple[str, str]]]:
+    # -z: NUL-terminated entries with raw (unquoted) paths
+    result = subprocess.run(["git", "status", "-z", "--porcelain"], capture_output=True)
     if result.returncode != 0:
         raise click.ClickException("Not a git repository or git not available.")
-    staged, modified, deleted, untracked = [], [], [], []
-    for line in result.stdout.splitlines():
-        if len(line) < 4:
+    buckets: tuple[list, list, list, list] = ([], [], [], [])
+    tokens = iter(result.stdout.split(b"\0"))
+    for entry in tokens:
+        if len(entry) < 4:
             continue
-        x, y = line[0], line[1]
-        path = line[3:]
-        if x == "?" and y == "?":
-            untracked.append(("?", path))
-        else:
-            if x not in (" ", "?"):
-                staged.append((x, path))
-            if y not in (" ", "?"):
-                if y == "D":
-                    deleted.append(("D", path))
-                else:
-                    modified.append((y, path))
-    return staged, modified, deleted, untracked
+        xy = entry[:2]
+        if xy[0] in b"RC" or xy[1] in b"RC":
+            # rename/copy (index or worktree side): the source path follows as its own entry
+            next(tokens, None)
+        routes = _status_routes(xy)
+        if not routes:
+            continue
+        path = entry[3:].decode("utf-8", "surrogateescape")
+        for bucket, code in routes:
+            buckets[bucket].append((code, path))
+    return buckets
 
 
 def get_current_branch() -> str | None:
-    """Return the current git branch name, or None if not on a branch."""
-    result = subprocess.run(
-        ["git", "symbolic-ref", "--short", "HEAD"],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0:
-        return None
-    return result.stdout.strip() or None
+    """Return the current git branch name, or None if not on a branch.
+
+    Cached until .git/HEAD changes or invalidate_git_cache() is called.
+    """
+    global _current_branch_cache
+    key = _head_key()
+    if key is not None:
+        if _branch_context_cache is not None and _branch_context_cache[0] == key:
+            return _branch_context_cache[1][0]
+        if _current_branch_cache is not None and _current_branch_cache[0] == key:
+            return _current_branch_cache[1]
+    branch = _symbolic_head()
+    if key is not None:
+        _current_branch_cache = (key, branch)
+    return branch
+
+
+def _symbolic_head() -> str | None:
+    """Branch HEAD points at (even one with no commits yet), or None when detached.
+
+    Strips refs/heads/ itself rather than using --short, which would turn a
+    branch sharing a tag's name into "heads/<name>".
+    """
+    result = subprocess.run(["git", "symbolic-ref", "-q", "HEAD"], capture_output=True, text=True)
+    ref = result.stdout.strip() if result.returncode == 0 else ""
+    return ref.removeprefix("refs/heads/") or None
 
 
 def check_not_main_branch() -> None:
@@ -52,19 +221,78 @@ def check_not_main_branch() -> None:
 
 
 def get_default_branch() -> str:
-    """Return the default branch name by asking origin, falling back to main/master."""
+    """Return the default branch name by asking origin, falling back to main/master.
+
+    Memoized per repository for the life of the process.
+    """
+    git_dir = _find_git_dir()
+    key = str(git_dir) if git_dir is not None else None
+    if key is not None and key in _default_branch_cache:
+        return _default_branch_cache[key]
     result = subprocess.run(
         ["git", "symbolic-ref", "refs/remotes/origin/HEAD"],
         capture_output=True, text=True,
     )
+    default = _default_branch_from(result)
+    if key is not None:
+        _default_branch_cache[key] = default
+    return default
+
+
+def get_branch_context() -> tuple[str | None, str]:
+    """Return (current branch or None, default branch) from a single git call.
+
+    One for-each-ref over refs/heads and origin/HEAD yields the checked-out branch
+    (%(HEAD) marker), origin's default (%(symref)) and the local names for the
+    main/master fallback. Cached until .git/HEAD changes.
+    """
+    global _branch_context_cache
+    key = _head_key()
+    if key is not None and _branch_context_cache is not None and _branch_context_cache[0] == key:
+        return _branch_context_cache[1]
+
+    result = subprocess.run(
+        ["git", "for-each-ref", "--format=%(HEAD)%(refname)%00%(symref)",
+         "refs/heads/", "refs/remotes/origin/HEAD"],
+        capture_output=True, text=True,
+    )
+    current: str | None = None
+    origin_default: str | None = None
+    local: set[str] = set()
+    for line in result.stdout.splitlines():
+        ref, _, symref = line[1:].partition("\0")
+        if ref == "refs/remotes/origin/HEAD":
+            if symref:
+                origin_default = symref.split("/")[-1]
+            continue
+        name = ref.removeprefix("refs/heads/")
+        local.add(name)
+        if line[:1] == "*":
+            current = name
+    if current is None:
+        # An unborn branch (no commits yet) has no ref for for-each-ref to mark
+        current = _symbolic_head()
+    if origin_default is None:
+        origin_default = next((n for n in ("main", "master") if n in local), "main")
+    context = (current, origin_default)
+    if key is not None:
+        _branch_context_cache = (key, context)
+        _default_branch_cache[key[0]] = origin_default
+    return context
+
+
+def _default_branch_from(result: subprocess.CompletedProcess) -> str:
+    """Parse `git symbolic-ref refs/remotes/origin/HEAD`, falling back to main/master."""
     if result.returncode == 0:
         # e.g. "refs/remotes/origin/main\n"
         return result.stdout.strip().split("/")[-1]
-    # Fallback: look for main or master in local branches
+    # Fallback: look for main or master in local branches (plumbing — no
+    # decoration or "* " markers to strip)
     branches_out = subprocess.run(
-        ["git", "branch"], capture_output=True, text=True,
+        ["git", "for-each-ref", "--format=%(refname:short)", "refs/heads/"],
+        capture_output=True, text=True,
     ).stdout
-    local = {b.lstrip("* ").strip() for b in branches_out.splitlines()}
+    local = set(branches_out.splitlines())
     for name in ("main", "master"):
         if name in local:
             return name
@@ -79,16 +307,18 @@ def get_ticket_branches(ticket: str) -> list[dict]:
     - tracking: "local", "remote", or "tracked"
     - status: "never pushed", "remote only", "remote deleted", or "" (healthy)
     """
-    current = get_current_branch()
     ticket_lower = ticket.lower()
-
-    # Local branches with upstream and tracking state
-    result = subprocess.run(
+    head, result, remotes = run_git_batch([
+        ["git", "symbolic-ref", "--short", "HEAD"],
+        # Local branches with upstream and tracking state
         ["git", "for-each-ref",
          "--format=%(refname:short)\t%(upstream:short)\t%(upstream:track)",
          "refs/heads/"],
-        capture_output=True, text=True,
-    )
+        # Remote branches
+        ["git", "for-each-ref", "--format=%(refname:short)", "refs/remotes/origin/"],
+    ])
+    current = (head.stdout.strip() or None) if head.returncode == 0 else None
+
     # name -> (tracking, status)
     local_branches: dict[str, tuple[str, str]] = {}
     for line in result.stdout.splitlines():
@@ -107,13 +337,8 @@ def get_ticket_branches(ticket: str) -> list[dict]:
         else:
             local_branches[branch] = ("tracked", "")
 
-    # Remote branches
-    result = subprocess.run(
-        ["git", "for-each-ref", "--format=%(refname:short)", "refs/remotes/origin/"],
-        capture_output=True, text=True,
-    )
     remote_only: list[str] = []
-    for line in result.stdout.splitlines():
+    for line in remotes.stdout.splitlines():
         ref = line.strip()
         if not ref or ref == "origin/HEAD":
             continue
@@ -133,6 +358,35 @@ def get_ticket_branches(ticket: str) -> list[dict]:
     return branches
 
 
+def get_prunable_branches() -> list[dict]:
+    """Return local branches `jg prune` offers for deletion, from the current refs.
+
+    Each dict: {name, status} where status is "remote deleted" (upstream gone)
+    or "never pushed" (no upstream on origin). The current and default branches
+    are never included.
+    """
+    result = subprocess.run(
+        # lstrip=2 rather than :short — a branch sharing a tag's name would
+        # otherwise come back as "heads/<name>"
+        ["git", "for-each-ref", "--format=%(refname:lstrip=2)%00%(upstream:track)%00%(upstream)",
+         "refs/heads/"],
+        capture_output=True, text=True, check=True,
+    )
+    current, default_branch = get_branch_context()
+
+    branches: list[dict] = []
+    for line in result.stdout.splitlines():
+        branch, _, rest = line.partition("\0")
+        track, _, upstream = rest.partition("\0")
+        if not branch or branch in (current, default_branch):
+            continue
+        if track == "[gone]":
+            branches.append({"name": branch, "status": "remote deleted"})
+        elif not upstream.startswith("refs/remotes/origin/"):
+            branches.append({"name": branch, "status": "never pushed"})
+    return branches
+
+
 def create_branch(name: str, base: str | None = None) -> None:
     """Create and switch to *name*, optionally branching from *base*."""
     cmd = ["git", "switch", "-C", name]
@@ -141,25 +395,47 @@ def create_branch(name: str, base: str | None = None) -> None:
         click.echo(f"Creating branch: {name} (from {base})")
     else:
         click.echo(f"Creating branch: {name}")
-    subprocess.run(cmd, check=True)
+    try:
+        subprocess.run(cmd, check=True)
+    finally:
+        invalidate_git_cache()
 
 
 def switch_branch(name: str) -> None:
     """Switch to *name*, raising ClickException on failure."""
     result = subprocess.run(["git", "switch", name], capture_output=True, text=True)
+    invalidate_git_cache()
     if result.returncode == 0:
         click.echo(f"Switched to branch: {name}")
     else:
         raise click.ClickException(f"Failed to switch to '{name}':\n{result.stderr.strip()}")
 
 
+def _resolve_clipboard_cmds() -> list[list[str]]:
+    """Return the clipboard tools found on PATH, in preference order (no subprocess probing)."""
+    cmds = []
+    for cmd in _CLIPBOARD_TOOLS:
+        path = shutil.which(cmd[0])
+        if path:
+            cmds.append([path, *cmd[1:]])
+    return cmds
+
+
 def copy_to_clipboard(text: str) -> bool:
-    """Copy text to system clipboard. Returns True on success."""
-    for cmd in (["pbcopy"], ["wl-copy"], ["xclip", "-selection", "clipboard"]):
+    """Copy text to system clipboard. Returns True on success.
+
+    Installed tools are tried in order until one succeeds, so e.g. wl-copy
+    failing outside a Wayland session falls through to xclip.
+    """
+    global _clipboard_cmds
+    if _clipboard_cmds is None:
+        _clipboard_cmds = _resolve_clipboard_cmds()
+    data = text.encode()
+    for cmd in _clipboard_cmds:
         try:
-            result = subprocess.run(cmd, input=text.encode(), capture_output=True)
-            if result.returncode == 0:
-                return True
-        except FileNotFoundError:
+            result = subprocess.run(cmd, input=data, capture_output=True)
+        except OSError:
             continue
+        if result.returncode == 0:
+            return True
     return False
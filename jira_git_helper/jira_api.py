@@ -1,14 +1,27 @@
 from __future__ import annotations
 
-import json
+import hashlib
+import os
 import shutil
 import subprocess
+import threading
+import time
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
 
 import click
-import requests
-from jira import JIRA, JIRAError
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    import requests
+    from jira import JIRA
 
 from .config import (
+    CACHE_DIR,
+    _json_dumps,
+    _json_loads,
+    _load_config,
     get_config,
     get_projects,
     get_jql_for_project,
@@ -16,10 +29,40 @@ from .config import (
     _FALLBACK_JQL,
 )
 
+# Process-wide JIRA client, built once by get_jira_client()
+_jira_client: JIRA | None = None
+
+# Process-wide keep-alive session for raw REST calls, built once by _http_session()
+_http: requests.Session | None = None
+
 # --- JIRA field caches ---
 
 _field_id_by_name: dict[str, str] = {}   # lower display name → field id
 _field_name_by_id: dict[str, str] = {}   # field id → display name
+_fields_lock = threading.Lock()          # populated from worker threads too
+_fields_from_disk = False                # maps came from _FIELDS_CACHE_FILE, not JIRA itself
+
+# On-disk copy of the field map so cold starts skip the jira.fields() round-trip
+_FIELDS_CACHE_FILE = CACHE_DIR / "fields.json"
+_FIELDS_CACHE_TTL = 24 * 60 * 60  # seconds
+
+# Last picker search, so reopening the picker within the TTL skips the network
+_ISSUES_CACHE_FILE = CACHE_DIR / "issues.json"
+_ISSUES_CACHE_TTL = 30  # seconds
+
+# Single-issue payloads from get_issue_raw(), so re-running jg info/debug is instant
+_ISSUE_CACHE_TTL = 30  # seconds
+
+# --- issue search fields ---
+
+# Columns rendered by the ticket picker
+ISSUE_FIELDS = ["summary", "status", "assignee", "priority"]
+# Only needed for the picker's tree view (parent-child hierarchy)
+TREE_FIELDS = ["parent", "issuetype"]
+# Rendered by build_ticket_info() in the ticket info views
+TICKET_INFO_FIELDS = [
+    "summary", "status", "assignee", "reporter", "priority", "labels", "description", "issuetype",
+]
 
 # --- Rich style dicts ---
 
@@ -62,45 +105,254 @@ def get_jira_server() -> str:
 
 
 def get_jira_client() -> JIRA:
+    """Return the shared JIRA client, building it on first use."""
+    global _jira_client
+    if _jira_client is not None:
+        return _jira_client
     server = get_jira_server()
-    token = get_config("token")
+    email, token = _jira_auth()
+    # Imported here: jira (and requests underneath it) are slow to import and
+    # most jg commands never talk to JIRA.
+    from jira import JIRA
+
+    _jira_client = JIRA(server=server, basic_auth=(email, token))
+    return _jira_client
+
+
+def _jira_auth() -> tuple[str, str]:
+    """Return the configured (email, token), raising ClickException if either is missing."""
+    config = _load_config()
+    token = config.get("token")
     if not token:
         raise click.ClickException(
             "JIRA token not configured. Run: jg config set token <api-token>"
         )
-    email = get_config("email")
+    email = config.get("email")
     if not email:
         raise click.ClickException(
             "JIRA email not configured. Run: jg config set email you@example.com"
         )
-    return JIRA(server=server, basic_auth=(email, token))
+    return email, token
+
+
+def get_issue_raw(key: str, fields: str | None = None, use_cache: bool = True) -> dict:
+    """Fetch an issue's raw REST payload, bypassing the jira client and its Resource wrapping.
+
+    *fields* is passed through as JIRA's comma-separated ``fields`` parameter
+    (e.g. ``*all,-comment,-worklog``); None returns every field.
+
+    Responses are kept on disk for _ISSUE_CACHE_TTL seconds per (server, key,
+    fields); pass use_cache=False to force a fresh fetch.
+    Raises requests.HTTPError on a non-2xx response.
+    """
+    server = get_jira_server()
+    digest = hashlib.sha1(_json_dumps([server, key, fields]).encode()).hexdigest()[:16]
+    cache_file = CACHE_DIR / f"issue-{digest}.json"
+    if use_cache:
+        try:
+            if time.time() - cache_file.stat().st_mtime <= _ISSUE_CACHE_TTL:
+                return _json_loads(cache_file.read_bytes())
+        except (OSError, ValueError):
+            pass
+
+    r = _http_session().get(
+        f"{server}/rest/api/2/issue/{key}",
+        params={"fields": fields} if fields else None,
+        auth=_jira_auth(),
+        headers={"Accept": "application/json"},
+        timeout=15,
+    )
+    r.raise_for_status()
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_suffix(".tmp")
+        tmp.write_bytes(r.content)
+        os.replace(tmp, cache_file)
+    except OSError:
+        pass  # cache is best-effort
+    return _json_loads(r.content)
+
+
+def _http_session() -> requests.Session:
+    """Return the shared requests session so repeat calls reuse TCP/TLS connections."""
+    global _http
+    if _http is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _http = session
+    return _http
+
+
+def _load_fields_cache(server: str) -> dict[str, str] | None:
+    """Return the on-disk field map for *server* if present and fresh, else None."""
+    try:
+        if time.time() - _FIELDS_CACHE_FILE.stat().st_mtime > _FIELDS_CACHE_TTL:
+            return None
+        data = _json_loads(_FIELDS_CACHE_FILE.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("server") != server:
+        return None
+    return data.get("fields") or None
+
+
+def _save_fields_cache(server: str, names: dict[str, str]) -> None:
+    try:
+        _FIELDS_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp = _FIELDS_CACHE_FILE.with_suffix(".tmp")
+        tmp.write_bytes(_json_dumps({"server": server, "fields": names}).encode())
+        os.replace(tmp, _FIELDS_CACHE_FILE)
+    except OSError:
+        pass  # cache is best-effort
+
+
+def _set_field_names(names: dict[str, str]) -> None:
+    for fid, fname in names.items():
+        _field_id_by_name[fname.lower()] = fid
+    _field_name_by_id.update(names)
+
+
+def _fetch_fields(jira_client: JIRA, server: str) -> None:
+    """Load the field map from JIRA and refresh the on-disk copy. Call with _fields_lock held."""
+    global _fields_from_disk
+    names = {field["id"]: field["name"] for field in jira_client.fields()}
+    _save_fields_cache(server, names)
+    _set_field_names(names)
+    _fields_from_disk = False
 
 
-def ensure_fields_cached(jira_client: JIRA) -> None:
-    if _field_name_by_id:
+def _fields_stale(field_ids: Iterable[str]) -> bool:
+    """True if the map came from disk and doesn't know one of *field_ids*."""
+    return _fields_from_disk and any(fid not in _field_name_by_id for fid in field_ids)
+
+
+def ensure_fields_cached(jira_client: JIRA, field_ids: Iterable[str] = ()) -> None:
+    """Populate the field maps, from the on-disk cache when it is fresh.
+
+    A disk-cached map can predate a custom field added on the server, so if
+    any of *field_ids* is missing from it the map is refetched from JIRA
+    (at most once per process).
+    """
+    field_ids = tuple(field_ids)
+    if _field_name_by_id and not _fields_stale(field_ids):
         return
-    for field in jira_client.fields():
-        _field_id_by_name[field["name"].lower()] = field["id"]
-        _field_name_by_id[field["id"]] = field["name"]
+    with _fields_lock:
+        global _fields_from_disk
+        server = get_jira_server()
+        if not _field_name_by_id:
+            names = _load_fields_cache(server)
+            if names is not None:
+                _set_field_names(names)
+                _fields_from_disk = True
+        if not _field_name_by_id or _fields_stale(field_ids):
+            _fetch_fields(jira_client, server)
 
 
 def get_jira_field_id(jira_client: JIRA, field_name: str) -> str | None:
     ensure_fields_cached(jira_client)
-    return _field_id_by_name.get(field_name.lower())
+    fid = _field_id_by_name.get(field_name.lower())
+    if fid is None and _fields_from_disk:
+        with _fields_lock:
+            if _fields_from_disk:  # an unknown name may be a field added since the cache was written
+                _fetch_fields(jira_client, get_jira_server())
+        fid = _field_id_by_name.get(field_name.lower())
+    return fid
 
 
 def get_jira_field_name(field_id: str) -> str:
     return _field_name_by_id.get(field_id, field_id)
 
 
+def get_jira_field_names(jira_client: JIRA, field_ids: list[str]) -> dict[str, str]:
+    """Map each field id to its display name (falling back to the id) in one pass.
+
+    Touches JIRA (or the on-disk field cache) only when there is something to name.
+    """
+    if not field_ids:
+        return {}
+    ensure_fields_cached(jira_client, field_ids)
+    names = _field_name_by_id
+    return {fid: names.get(fid, fid) for fid in field_ids}
+
+
+def prefetch_issue(jira_client: JIRA, key: str, fields: list[str]) -> Future:
+    """Start fetching *key* on a daemon thread and return a Future for the issue.
+
+    Lets a TUI overlap the JIRA round-trip with its own startup; the daemon
+    thread never holds up interpreter exit if the user quits first.
+    """
+    from concurrent.futures import Future  # deferred: pulls in logging
+
+    future: Future = Future()
+
+    def run() -> None:
+        try:
+            future.set_result(jira_client.issue(key, fields=fields))
+        except Exception as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, daemon=True).start()
+    return future
+
+
+def _issues_cache_key(projects: list[str], fields: list[str], max_results: int) -> str:
+    """Hash everything that shapes a search: server, resolved JQL, fields and limit."""
+    jqls = [get_jql_for_project(p) for p in projects]
+    blob = _json_dumps([get_jira_server(), projects, jqls, fields, max_results])
+    return hashlib.sha1(blob.encode()).hexdigest()
+
+
+def _load_issues_cache(key: str) -> list | None:
+    """Return cached issues for *key* if present and fresh, else None.
+
+    The cache holds each issue's raw REST dict; they come back as read-only
+    attribute wrappers (jira.resources.dict2resource), which is all the picker
+    reads — ``issue.key``, ``issue.id``, ``issue.fields.<field>``.
+    """
+    try:
+        if time.time() - _ISSUES_CACHE_FILE.stat().st_mtime > _ISSUES_CACHE_TTL:
+            return None
+        data = _json_loads(_ISSUES_CACHE_FILE.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("key") != key:
+        return None
+    from jira.resources import dict2resource
+
+    return [dict2resource(raw) for raw in data.get("issues", [])]
+
+
+def _save_issues_cache(key: str, issues: list) -> None:
+    try:
+        _ISSUES_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp = _ISSUES_CACHE_FILE.with_suffix(".tmp")
+        tmp.write_bytes(_json_dumps({"key": key, "issues": [i.raw for i in issues]}).encode())
+        os.replace(tmp, _ISSUES_CACHE_FILE)
+    except OSError:
+        pass  # cache is best-effort
+
+
 def fetch_issues_for_projects(
     jira: JIRA,
     projects: list[str],
     max_results: int,
     extra_fields: list[str] | None = None,
+    use_cache: bool = True,
 ) -> list:
     """Fetch issues across all configured projects, returning a merged list.
 
+    Only the fields the picker renders are requested, plus TREE_FIELDS since
+    every picker can switch to tree view.
+
+    Results are kept on disk for _ISSUES_CACHE_TTL seconds, keyed by the
+    resolved JQL and fields, so reopening the picker is instant. Pass
+    use_cache=False to force a fresh search (e.g. an explicit refresh).
+
     Strategy:
     - 0 projects: use _FALLBACK_JQL (single query)
     - 1 project: use get_jql_for_project() (single query)
@@ -109,32 +361,55 @@ def fetch_issues_for_projects(
     - Multiple projects, any with an active filter: run one query per project
       and merge/deduplicate in Python
     """
-    fields = ["summary", "status", "assignee", "priority", "parent", "issuetype"] + (extra_fields or [])
+    fields = ISSUE_FIELDS + TREE_FIELDS + (extra_fields or [])
 
+    key = _issues_cache_key(projects, fields, max_results)
+    if use_cache:
+        cached = _load_issues_cache(key)
+        if cached is not None:
+            return cached
+    issues = _search_projects(jira, projects, max_results, fields)
+    _save_issues_cache(key, issues)
+    return issues
+
+
+def _search_projects(jira: JIRA, projects: list[str], max_results: int, fields: list[str]) -> list:
+    # search_issues() already pages through results up to maxResults and returns a
+    # list subclass, so results are used as-is rather than copied.
     if not projects:
-        return list(jira.search_issues(_FALLBACK_JQL, maxResults=max_results, fields=fields))
+        return jira.search_issues(_FALLBACK_JQL, maxResults=max_results, fields=fields)
 
     if len(projects) == 1:
-        return list(jira.search_issues(
+        return jira.search_issues(
             get_jql_for_project(projects[0]), maxResults=max_results, fields=fields
-        ))
+        )
 
-    # Multiple projects
-    has_custom_jql = any(get_effective_filter_name(p) for p in projects)
+    # Multiple projects — resolve each project's active filter once
+    active = {p: get_effective_filter_name(p) for p in projects}
+    has_custom_jql = any(active.values())
 
     if not has_custom_jql:
         project_clause = " OR ".join(f"project = {p}" for p in projects)
         combined_jql = f"({project_clause}) AND assignee = currentUser() ORDER BY updated DESC"
-        return list(jira.search_issues(combined_jql, maxResults=max_results, fields=fields))
+        return jira.search_issues(combined_jql, maxResults=max_results, fields=fields)
 
-    # Per-project queries — merge and deduplicate, preserving insertion order
+    # Per-project queries run concurrently; results are merged in project order
+    # and deduplicated, preserving insertion order
     seen: set[str] = set()
     merged = []
     per_project_max = max(50, max_results // len(projects))
-    for project in projects:
-        for issue in jira.search_issues(
-            get_jql_for_project(project), maxResults=per_project_max, fields=fields
-        ):
+    from concurrent.futures import ThreadPoolExecutor  # deferred: pulls in logging
+
+    with ThreadPoolExecutor(max_workers=min(8, len(projects))) as pool:
+        futures = [
+            pool.submit(
+                jira.search_issues,
+                get_jql_for_project(project), maxResults=per_project_max, fields=fields,
+            )
+            for project in projects
+        ]
+    for future in futures:
+        for issue in future.result():
             if issue.key not in seen:
                 seen.add(issue.key)
                 merged.append(issue)
@@ -144,18 +419,17 @@ def fetch_issues_for_projects(
 def get_prs(issue_id: str) -> list[dict]:
     """Fetch linked GitHub PRs via the JIRA dev-status API."""
     server = get_jira_server()
-    token = get_config("token")
-    email = get_config("email")
-    r = requests.get(
+    config = _load_config()
+    r = _http_session().get(
         f"{server}/rest/dev-status/1.0/issue/details",
         params={"issueId": issue_id, "applicationType": "GitHub", "dataType": "pullrequest"},
-        auth=(email, token),
+        auth=(config.get("email"), config.get("token")),
         headers={"Accept": "application/json"},
         timeout=15,
     )
     r.raise_for_status()
     prs: list[dict] = []
-    for detail in r.json().get("detail", []):
+    for detail in _json_loads(r.content).get("detail", []):
         prs.extend(detail.get("pullRequests", []))
     return prs
 
@@ -170,13 +444,13 @@ def get_gh_prs(ticket: str) -> list[dict]:
     result = subprocess.run(
         ["gh", "pr", "list", "--search", ticket, "--state", "all",
          "--json", "title,url,author,headRefName,state,updatedAt"],
-        capture_output=True, text=True,
+        capture_output=True,  # bytes: parsed directly, no decode pass
     )
     if result.returncode != 0 or not result.stdout.strip():
         return []
     try:
-        items = json.loads(result.stdout)
-    except json.JSONDecodeError:
+        items = _json_loads(result.stdout)
+    except ValueError:
         return []
     prs: list[dict] = []
     for item in items:
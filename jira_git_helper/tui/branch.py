@@ -2,19 +2,19 @@
 
 from __future__ import annotations
 
-import shutil
 import subprocess
 
+from rich.text import Text as RichText
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import ScrollableContainer
 from textual.screen import ModalScreen
 from textual.widgets import DataTable, Footer, Input, Label, Static
 
-from ..jira_api import get_jira_server
+from ..jira_api import prefetch_issue, TICKET_INFO_FIELDS
 from .theme import (
     SCREEN_CSS, CONTEXT_BAR_CSS, DATATABLE_CSS, FILTER_BAR_CSS, FOOTER_CSS,
-    context_bar_text, build_ticket_info,
+    context_bar_text, load_ticket_info, colorize_diff, delta_path,
     cursor_row_key, FilterBarMixin,
 )
 
@@ -43,6 +43,8 @@ class BranchPromptApp(App):
         super().__init__()
         self._ticket = ticket
         self._jira_client = jira_client
+        # Started now so the round-trip overlaps with compose/mount
+        self._issue_future = prefetch_issue(jira_client, ticket, TICKET_INFO_FIELDS)
         self.branch_suffix: str | None = None
 
     def compose(self) -> ComposeResult:
@@ -58,17 +60,9 @@ class BranchPromptApp(App):
         self.run_worker(self._fetch_info, thread=True)
 
     def _fetch_info(self) -> None:
-        try:
-            issue = self._jira_client.issue(
-                self._ticket,
-                fields=["summary", "status", "assignee", "reporter", "priority", "labels", "description", "issuetype"],
-            )
-        except Exception as e:
-            self.call_from_thread(self._update_content, f"[red]Error loading ticket info: {e}[/red]")
-            return
-
-        content = build_ticket_info(issue, get_jira_server())
-        self.call_from_thread(self._update_content, content)
+        content = load_ticket_info(self._issue_future, "Error loading ticket info")
+        if content is not None:
+            self.call_from_thread(self._update_content, content)
 
     def _update_content(self, content) -> None:
         self.query_one("#bp-content", Static).update(content)
@@ -115,6 +109,13 @@ class BranchPickerApp(FilterBarMixin, App):
         self.all_branches = branches
         self.selected_branch: str | None = None
         self.create_new: bool = False
+        # Lowercased haystack per branch (name, tracking, status), built once
+        self._search_blobs: dict[str, str] = {
+            b["name"]: "\n".join((b["name"], b["tracking"], b["status"])).lower()
+            for b in branches
+        }
+        self._row_cache: dict[str, tuple] = {}
+        self._last_filter = ""  # filter text the table currently reflects
 
     def compose(self) -> ComposeResult:
         yield Static(context_bar_text(), classes="context-bar")
@@ -131,34 +132,43 @@ class BranchPickerApp(FilterBarMixin, App):
         self._populate_table(self.all_branches)
         table.focus()
 
-    def _populate_table(self, branches: list[dict]) -> None:
-        from rich.text import Text as RichText
-
-        table = self.query_one(DataTable)
-        table.clear()
-        for b in branches:
+    def _row_cells(self, b: dict) -> tuple:
+        """Styled cells for branch *b*, built on first display and reused after."""
+        cells = self._row_cache.get(b["name"])
+        if cells is None:
             name, is_current = b["name"], b["is_current"]
             tracking, status = b["tracking"], b["status"]
             marker = RichText("*", style="bold #00ff41") if is_current else RichText("")
             label = RichText(name, style="bold #00e5ff") if is_current else RichText(name, style="#b8d4b8")
             tracking_text = RichText(tracking, style=self.TRACKING_STYLES.get(tracking, "#b8d4b8"))
             status_text = RichText(status, style=self.STATUS_STYLES.get(status, "#b8d4b8")) if status else RichText("")
-            table.add_row(marker, label, tracking_text, status_text, key=name)
+            cells = self._row_cache[name] = (marker, label, tracking_text, status_text)
+        return cells
+
+    def _populate_table(self, branches: list[dict]) -> None:
+        table = self.query_one(DataTable)
+        with self.batch_update():
+            table.clear()
+            for b in branches:
+                table.add_row(*self._row_cells(b), key=b["name"])
 
     def on_input_changed(self, event: Input.Changed) -> None:
+        if event.value == self._last_filter:
+            return
+        self._last_filter = event.value
         search = event.value.lower()
-        filtered = [
-            b for b in self.all_branches
-            if not search or search in b["name"].lower()
-            or search in b["tracking"].lower() or search in b["status"].lower()
-        ]
+        blobs = self._search_blobs
+        filtered = [b for b in self.all_branches if search in blobs[b["name"]]]
         self._populate_table(filtered)
 
     def on_key(self, event) -> None:
-        if self._handle_filter_keys(event):
-            return
+        # Only the filter bar needs raw key handling; table navigation is the
+        # DataTable's own bindings and escape/enter are BINDINGS.
+        if isinstance(self.focused, Input):
+            self._handle_filter_keys(event)
 
     def _reset_filter(self) -> None:
+        self._last_filter = ""
         self._populate_table(self.all_branches)
 
     def action_select_branch(self) -> None:
@@ -180,6 +190,12 @@ class BranchPickerApp(FilterBarMixin, App):
         self.exit()
 
     def action_quit(self) -> None:
+        bar = self.query_one("#filter-bar", Input)
+        if bar.display:  # first escape clears an open filter
+            bar.value = ""
+            bar.display = False
+            self._reset_filter()
+            return
         self.exit()
 
 
@@ -214,18 +230,17 @@ class BranchDiffModal(ModalScreen):
             text=True,
         )
         raw = result.stdout or "No differences found."
-        if shutil.which("delta"):
+        delta = delta_path()
+        if delta:
             proc = subprocess.run(
-                ["delta", "--color-only"],
+                [delta, "--color-only"],
                 input=raw,
                 capture_output=True,
                 text=True,
             )
-            from rich.text import Text
-            content = Text.from_ansi(proc.stdout if proc.returncode == 0 else raw)
+            content = RichText.from_ansi(proc.stdout if proc.returncode == 0 else raw)
         else:
-            from rich.syntax import Syntax
-            content = Syntax(raw, "diff", theme="monokai")
+            content = colorize_diff(raw)
         self.app.call_from_thread(self._update, content)
 
     def _update(self, content) -> None:
@@ -2,6 +2,13 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
+from collections.abc import Callable
+from functools import lru_cache
+from itertools import repeat
+from operator import itemgetter
+
+from rich.text import Text as RichText
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Vertical
@@ -9,11 +16,27 @@ from textual.screen import ModalScreen
 from textual.widgets import DataTable, Footer, Input, Label, Static
 
 from ..config import get_config, get_ticket
-from ..git import get_file_statuses
+from ..git import get_file_statuses, invalidate_status_cache
 from ..formatters import FILE_STATUS_LABELS
 from .theme import CONTEXT_BAR_CSS, DATATABLE_CSS, FOOTER_CSS, context_bar_text, cursor_row_key
 from .modals import FmtModal
 
+_SECTION_IDS = ("staged", "modified", "deleted", "untracked")
+
+# Section rows are kept sorted by (path, item key)
+_entry_order = itemgetter(1, 2)
+
+
+def _cell_plain(cell) -> str:
+    """Sort key for a FILE cell: its path text."""
+    return cell.plain
+
+
+@lru_cache(maxsize=None)
+def _status_cell(label: str, style: str):
+    """Shared STATUS cell — only a handful of (label, style) pairs ever occur."""
+    return RichText(label, style=style)
+
 
 class CommitModal(ModalScreen):
     CSS = FOOTER_CSS + """
@@ -79,24 +102,16 @@ class FilePickerApp(App):
         modified: list[tuple[str, str]],
         deleted: list[tuple[str, str]],
         untracked: list[tuple[str, str]],
+        git_root: str | None = None,
+        ticket: str | None = None,
     ) -> None:
         super().__init__()
-        self.orig_staged   = [(s, p, f"staged:{p}")    for s, p in staged]
-        self.orig_modified = [(s, p, f"modified:{p}")  for s, p in modified]
-        self.orig_deleted  = [(s, p, f"deleted:{p}")   for s, p in deleted]
-        self.orig_untracked= [(s, p, f"untracked:{p}") for s, p in untracked]
-
-        self.file_info: dict[str, tuple[str, str]] = {}
-        for status, path, ik in self.orig_staged:
-            self.file_info[ik] = (status, "staged")
-        for status, path, ik in self.orig_modified:
-            self.file_info[ik] = (status, "modified")
-        for status, path, ik in self.orig_deleted:
-            self.file_info[ik] = (status, "deleted")
-        for status, path, ik in self.orig_untracked:
-            self.file_info[ik] = (status, "untracked")
+        self.git_root = git_root
+        self._load_session_config(ticket)
+        self._set_statuses(staged, modified, deleted, untracked)
 
         self._staged_paths: list[str] = [ik for _, _, ik in self.orig_staged]
+        self._build_sections()
 
         self.to_stage: set[str] = set()
         self.to_unstage: set[str] = set()
@@ -106,26 +121,83 @@ class FilePickerApp(App):
 
     # --- data helpers ---
 
-    def _files_for_section(self, section_id: str) -> list[tuple[str, str, str]]:
+    def _load_session_config(self, ticket: str | None = None) -> None:
+        """Snapshot the ticket and fmt_on_add for the session; `r` re-reads them.
+
+        *ticket* skips the lookup when the caller has just resolved it.
+        """
+        self._ticket = ticket or get_ticket()
+        self._fmt_on_add = get_config("fmt_on_add") == "true"
+
+    def _set_statuses(
+        self,
+        staged: list[tuple[str, str]],
+        modified: list[tuple[str, str]],
+        deleted: list[tuple[str, str]],
+        untracked: list[tuple[str, str]],
+    ) -> None:
+        """Derive orig_* rows and file_info from a get_file_statuses() result."""
+        self.file_info: dict[str, tuple[str, str]] = {}
+        orig: list[list[tuple[str, str, str]]] = []
+        for kind, rows in zip(_SECTION_IDS, (staged, modified, deleted, untracked)):
+            # Column-wise: statuses, paths and item keys as parallel sequences
+            statuses, paths = zip(*rows) if rows else ((), ())
+            iks = [f"{kind}:{p}" for p in paths]
+            orig.append(list(zip(statuses, paths, iks)))
+            self.file_info.update(zip(iks, zip(statuses, repeat(kind))))
+        self.orig_staged, self.orig_modified, self.orig_deleted, self.orig_untracked = orig
+
+    def _build_sections(self) -> None:
+        """Index every file by the section it currently shows in, each sorted by path.
+
+        _home maps an item key to the section it returns to when unstaged; originally
+        staged files go to modified/deleted/untracked according to their status.
+        """
+        self._home: dict[str, str] = {}
+        for s, _, ik in self.orig_staged:
+            self._home[ik] = "untracked" if s in ("A", "?") else "deleted" if s == "D" else "modified"
+        for section_id, entries in (
+            ("modified", self.orig_modified),
+            ("deleted", self.orig_deleted),
+            ("untracked", self.orig_untracked),
+        ):
+            for _, _, ik in entries:
+                self._home[ik] = section_id
+
         staged_set = set(self._staged_paths)
-        if section_id == "staged":
-            return sorted(
-                [(self.file_info[ik][0], ik.split(":", 1)[1], ik) for ik in self._staged_paths],
-                key=lambda x: x[1],
-            )
-        if section_id == "modified":
-            files = [(s, p, ik) for s, p, ik in self.orig_modified if ik not in staged_set]
-            files += [(s, p, ik) for s, p, ik in self.orig_staged if ik not in staged_set and s not in ("A", "?", "D")]
-            return sorted(files, key=lambda x: x[1])
-        if section_id == "deleted":
-            files = [(s, p, ik) for s, p, ik in self.orig_deleted if ik not in staged_set]
-            files += [(s, p, ik) for s, p, ik in self.orig_staged if ik not in staged_set and s == "D"]
-            return sorted(files, key=lambda x: x[1])
-        if section_id == "untracked":
-            files = [(s, p, ik) for s, p, ik in self.orig_untracked if ik not in staged_set]
-            files += [(s, p, ik) for s, p, ik in self.orig_staged if ik not in staged_set and s in ("A", "?")]
-            return sorted(files, key=lambda x: x[1])
-        return []
+        # Rows are (status, path, item_key, path_lower) — lowercased once for filtering
+        self._section_cache: dict[str, list[tuple[str, str, str, str]]] = {
+            "staged": [], "modified": [], "deleted": [], "untracked": [],
+        }
+        for entries in (self.orig_staged, self.orig_modified, self.orig_deleted, self.orig_untracked):
+            for s, p, ik in entries:
+                section_id = "staged" if ik in staged_set else self._home[ik]
+                self._section_cache[section_id].append((s, p, ik, p.lower()))
+        for entries in self._section_cache.values():
+            entries.sort(key=_entry_order)
+
+    def _move_entry(self, item_key: str, src: str, dst: str) -> int:
+        """Move one file between two section indexes, keeping both sorted.
+
+        Returns the entry's new position in *dst*.
+        """
+        entries = self._section_cache[src]
+        status = self.file_info[item_key][0]
+        path = item_key.split(":", 1)[1]
+        entry = (status, path, item_key, path.lower())
+        order = _entry_order(entry)
+        del entries[bisect_left(entries, order, key=_entry_order)]
+        dst_entries = self._section_cache[dst]
+        index = bisect_left(dst_entries, order, key=_entry_order)
+        dst_entries.insert(index, entry)
+        return index
+
+    def _files_for_section(self, section_id: str) -> list[tuple[str, str, str, str]]:
+        """Return the section's (status, path, item_key, path_lower) rows, sorted by path.
+
+        The list is the live index — do not mutate it.
+        """
+        return self._section_cache.get(section_id, [])
 
     def _compute_ops(self) -> None:
         orig_staged_keys = {ik for _, _, ik in self.orig_staged}
@@ -159,35 +231,39 @@ class FilePickerApp(App):
         show_modified  = bool(self.orig_modified)  or any(s not in ("A", "?", "D") for s, _, _ in self.orig_staged)
         show_deleted   = bool(self.orig_deleted)   or any(s == "D"               for s, _, _ in self.orig_staged)
         show_untracked = bool(self.orig_untracked) or any(s in ("A", "?")        for s, _, _ in self.orig_staged)
-        self.query_one("#section-modified").display  = show_modified
-        self.query_one("#section-deleted").display   = show_deleted
-        self.query_one("#section-untracked").display = show_untracked
+        self._sections["modified"].display  = show_modified
+        self._sections["deleted"].display   = show_deleted
+        self._sections["untracked"].display = show_untracked
 
     def on_mount(self) -> None:
-        self._init_table("staged")
-        self._init_table("modified")
-        self._init_table("deleted")
-        self._init_table("untracked")
+        # Widget handles looked up once; section id → widget
+        self._tables: dict[str, DataTable] = {
+            tid: self.query_one(f"#{tid}", DataTable) for tid in _SECTION_IDS
+        }
+        self._filter_inputs: dict[str, Input] = {
+            tid: self.query_one(f"#filter-{tid}", Input) for tid in _SECTION_IDS
+        }
+        self._sections = {
+            tid: self.query_one(f"#section-{tid}") for tid in ("modified", "deleted", "untracked")
+        }
+        with self.batch_update():
+            for tid in _SECTION_IDS:
+                self._init_table(tid)
         self._update_section_visibility()
         for tid in ("modified", "deleted", "untracked", "staged"):
-            t = self.query_one(f"#{tid}", DataTable)
+            t = self._tables[tid]
             if t.display and t.row_count > 0:
                 t.focus()
                 return
 
     def _init_table(self, table_id: str) -> None:
-        try:
-            table = self.query_one(f"#{table_id}", DataTable)
-        except Exception:
-            return
+        table = self._tables[table_id]
         table.add_column("STATUS", width=12)
-        table.add_column("FILE")
-        for status, path, item_key in self._files_for_section(table_id):
+        table.add_column("FILE", key="file")
+        for status, path, item_key, _ in self._files_for_section(table_id):
             self._add_row(table, status, path, item_key, table_id)
 
     def _add_row(self, table: DataTable, status: str, path: str, item_key: str, section_id: str) -> None:
-        from rich.text import Text as RichText
-
         is_untracked_type = status in ("A", "?")
 
         label = FILE_STATUS_LABELS.get(status, status)
@@ -209,26 +285,26 @@ class FilePickerApp(App):
             path_style = ""
 
         path_cell = RichText(path, style=path_style) if path_style else RichText(path)
-        table.add_row(RichText(label, style=status_style), path_cell, key=item_key)
+        table.add_row(_status_cell(label, status_style), path_cell, key=item_key)
 
     # --- refresh ---
 
     def _refresh_table(self, table_id: str) -> None:
-        try:
-            table = self.query_one(f"#{table_id}", DataTable)
-        except Exception:
+        table = self._tables.get(table_id)
+        if table is None:
             return
         all_files = self._files_for_section(table_id)
         filt = self._section_filters.get(table_id, "").lower()
-        files = [(s, p, ik) for s, p, ik in all_files if filt in p.lower()] if filt else all_files
+        files = [f for f in all_files if filt in f[3]] if filt else all_files
         cursor = table.cursor_row
-        table.clear()
-        for status, path, item_key in files:
-            self._add_row(table, status, path, item_key, table_id)
+        with self.batch_update():
+            table.clear()
+            for status, path, item_key, _ in files:
+                self._add_row(table, status, path, item_key, table_id)
         table.move_cursor(row=min(cursor, max(0, table.row_count - 1)))
 
     def _refresh_all(self) -> None:
-        for tid in ("staged", "modified", "deleted", "untracked"):
+        for tid in _SECTION_IDS:
             self._refresh_table(tid)
 
     # --- helpers ---
@@ -242,9 +318,11 @@ class FilePickerApp(App):
     def on_input_changed(self, event: Input.Changed) -> None:
         if event.input.id and event.input.id.startswith("filter-"):
             table_id = event.input.id.removeprefix("filter-")
+            event.stop()
+            if event.value == self._section_filters.get(table_id, ""):
+                return  # e.g. the bar being cleared after we already reset the filter
             self._section_filters[table_id] = event.value
             self._refresh_table(table_id)
-            event.stop()
 
     def on_key(self, event) -> None:
         focused = self.focused
@@ -256,16 +334,10 @@ class FilePickerApp(App):
                 focused.value = ""
                 focused.display = False
                 self._refresh_table(table_id)
-                try:
-                    self.query_one(f"#{table_id}", DataTable).focus()
-                except Exception:
-                    pass
+                self._tables[table_id].focus()
                 event.prevent_default()
             elif event.key == "enter":
-                try:
-                    self.query_one(f"#{table_id}", DataTable).focus()
-                except Exception:
-                    pass
+                self._tables[table_id].focus()
                 event.prevent_default()
             return
 
@@ -289,14 +361,10 @@ class FilePickerApp(App):
         table = self._focused_table()
         if table is None:
             return
-        filter_id = f"filter-{table.id}"
-        try:
-            filter_input = self.query_one(f"#{filter_id}", Input)
-            filter_input.display = True
-            filter_input.value = ""
-            filter_input.focus()
-        except Exception:
-            pass
+        filter_input = self._filter_inputs[table.id]
+        filter_input.display = True
+        filter_input.value = ""
+        filter_input.focus()
 
     def action_toggle_select(self) -> None:
         table = self._focused_table()
@@ -307,15 +375,45 @@ class FilePickerApp(App):
             return
         cursor = table.cursor_row
 
+        home = self._home[item_key]
         if table.id == "staged":
             self._staged_paths.remove(item_key)
+            src, dst = "staged", home
         else:
-            if item_key not in self._staged_paths:
-                self._staged_paths.append(item_key)
-
-        self._refresh_all()
+            if item_key in self._staged_paths:
+                return
+            self._staged_paths.append(item_key)
+            src, dst = home, "staged"
+        self._toggle_row(item_key, src, dst, self._move_entry(item_key, src, dst))
         table.move_cursor(row=min(cursor, max(0, table.row_count - 1)))
 
+    def _toggle_row(self, item_key: str, src: str, dst: str, index: int) -> None:
+        """Move one row between two tables without rebuilding either.
+
+        *index* is the entry's position in the *dst* section index. A row that
+        lands mid-table is placed with a sort on the FILE column; only when it
+        shares its path with a neighbour (which the sort can't order by item
+        key) is the destination table rebuilt.
+        """
+        src_table = self._tables.get(src)
+        if src_table is not None and item_key in src_table.rows:
+            src_table.remove_row(item_key)
+
+        dst_table = self._tables.get(dst)
+        if dst_table is None:
+            return
+        entries = self._section_cache[dst]
+        status, path, _, path_lower = entries[index]
+        filt = self._section_filters.get(dst, "").lower()
+        if filt and filt not in path_lower:
+            return
+        if any(0 <= i < len(entries) and entries[i][1] == path for i in (index - 1, index + 1)):
+            self._refresh_table(dst)
+            return
+        self._add_row(dst_table, status, path, item_key, dst)
+        if index < len(entries) - 1:
+            dst_table.sort("file", key=_cell_plain)
+
     def action_confirm(self) -> None:
         if len(self.screen_stack) > 1:
             top = self.screen
@@ -335,14 +433,16 @@ class FilePickerApp(App):
             self._compute_ops()
             self.exit()
             return
-        if get_config("fmt_on_add") == "true":
+        if self._fmt_on_add:
             self._pre_fmt_staged = set(self._staged_paths)
-            self.push_screen(FmtModal(), self._on_fmt_before_commit)
+            self.push_screen(FmtModal(self.git_root), self._on_fmt_before_commit)
         else:
-            self.push_screen(CommitModal(get_ticket()), self._on_commit_modal)
+            self.push_screen(CommitModal(self._ticket), self._on_commit_modal)
 
     def _on_fmt_before_commit(self, _: None) -> None:
-        self._reload_statuses()
+        self._reload_statuses(then=self._after_fmt_before_commit)
+
+    def _after_fmt_before_commit(self) -> None:
         if not self._staged_paths:
             self._compute_ops()
             self.exit()
@@ -354,7 +454,7 @@ class FilePickerApp(App):
                 timeout=6,
             )
             return
-        self.push_screen(CommitModal(get_ticket()), self._on_commit_modal)
+        self.push_screen(CommitModal(self._ticket), self._on_commit_modal)
 
     def _on_commit_modal(self, message: str | None) -> None:
         self._compute_ops()
@@ -369,31 +469,34 @@ class FilePickerApp(App):
     def action_refresh(self) -> None:
         if isinstance(self.focused, Input):
             return
+        invalidate_status_cache()  # an explicit refresh always re-reads the tree
+        self._load_session_config()
         self._reload_statuses()
 
     def action_run_fmt(self) -> None:
         if isinstance(self.focused, Input):
             return
-        self.push_screen(FmtModal(), self._on_fmt_closed)
+        self.push_screen(FmtModal(self.git_root), self._on_fmt_closed)
 
     def _on_fmt_closed(self, _: None) -> None:
         self._reload_statuses()
 
-    def _reload_statuses(self) -> None:
-        staged, modified, deleted, untracked = get_file_statuses()
-        self.orig_staged   = [(s, p, f"staged:{p}")    for s, p in staged]
-        self.orig_modified = [(s, p, f"modified:{p}")  for s, p in modified]
-        self.orig_deleted  = [(s, p, f"deleted:{p}")   for s, p in deleted]
-        self.orig_untracked= [(s, p, f"untracked:{p}") for s, p in untracked]
-        self.file_info = {}
-        for status, path, ik in self.orig_staged:
-            self.file_info[ik] = (status, "staged")
-        for status, path, ik in self.orig_modified:
-            self.file_info[ik] = (status, "modified")
-        for status, path, ik in self.orig_deleted:
-            self.file_info[ik] = (status, "deleted")
-        for status, path, ik in self.orig_untracked:
-            self.file_info[ik] = (status, "untracked")
+    def _reload_statuses(self, then: Callable[[], None] | None = None) -> None:
+        """Re-read git status off the event loop, then rebuild the tables.
+
+        *then* runs on the UI thread once the new statuses are in place.
+        """
+        self.run_worker(lambda: self._fetch_statuses(then), thread=True)
+
+    def _fetch_statuses(self, then: Callable[[], None] | None) -> None:
+        statuses = get_file_statuses()
+        self.call_from_thread(self._apply_statuses, statuses, then)
+
+    def _apply_statuses(self, statuses: tuple, then: Callable[[], None] | None) -> None:
+        self._set_statuses(*statuses)
         self._staged_paths = [ik for ik in self._staged_paths if ik in self.file_info]
+        self._build_sections()
         self._update_section_visibility()
         self._refresh_all()
+        if then is not None:
+            then()
@@ -119,6 +119,10 @@ class FmtModal(ModalScreen):
         Binding("escape", "close", show=False, priority=True),
     ]
 
+    def __init__(self, git_root: str | None = None) -> None:
+        super().__init__()
+        self._git_root = git_root
+
     def compose(self) -> ComposeResult:
         with Vertical(id="fmt-outer"):
             yield Label("Format results", id="fmt-title")
@@ -130,7 +134,7 @@ class FmtModal(ModalScreen):
         self.run_worker(self._run, thread=True)
 
     def _run(self) -> None:
-        msg, table = build_fmt_table()
+        msg, table = build_fmt_table(git_root=self._git_root)
         if msg == "clean":
             content = "Nothing to format — working tree clean."
         else:
@@ -2,28 +2,44 @@
 
 from __future__ import annotations
 
-import shutil
 import subprocess
 import webbrowser
 
+from rich.style import Style
+from rich.text import Span, Text as RichText
 from textual.app import App, ComposeResult
 from textual.binding import Binding
-from textual.containers import ScrollableContainer
 from textual.screen import ModalScreen
-from textual.widgets import DataTable, Footer, Input, Static
+from textual.widgets import DataTable, Footer, Input, RichLog, Static
+from textual.worker import get_current_worker
 
 from ..jira_api import PR_STATUS_STYLES
 from .theme import (
     SCREEN_CSS, CONTEXT_BAR_CSS, DATATABLE_CSS, FILTER_BAR_CSS, FOOTER_CSS,
-    context_bar_text, cursor_row_key, FilterBarMixin,
+    context_bar_text, colorize_diff, cursor_row_key, delta_path, FilterBarMixin,
 )
 
 
+# Row styles parsed once, not per cell
+_PR_STATUS_STYLE_OBJS = {k: Style.parse(v) for k, v in PR_STATUS_STYLES.items()}
+_DEFAULT_STATUS_STYLE = Style.parse("white")
+_GITHUB_STYLE = Style.parse("#00e5ff")
+_JIRA_STYLE = Style.parse("#ffb300")
+_DATE_STYLE = Style.parse("dim")
+_AUTHOR_STYLE = Style.parse("#b39ddb")
+_REPO_STYLE = Style.parse("#ffb300")
+_BRANCH_STYLE = Style.parse("#00e5ff")
+_TITLE_STYLE = Style.parse("#b8d4b8")
+_MATCH_STYLE = Style.parse("black on yellow")
+
+# Diff lines parsed and appended to the log per batch while delta output streams in
+_STREAM_CHUNK_LINES = 500
+
+
 class DiffModal(ModalScreen):
     CSS = FOOTER_CSS + """
     DiffModal { background: #0a0e0a 92%; }
-    #diff-scroll { width: 100%; height: 1fr; border: thick #00ff41; }
-    #diff-content { padding: 0; }
+    #diff-content { width: 100%; height: 1fr; border: thick #00ff41; padding: 0; }
     #search-bar { display: none; background: #0d1a0d; color: #ffb300; border: solid #ffb300; height: 3; }
     #search-bar:focus { border: solid #ffb300; }
     #search-status { display: none; background: #ffb300; color: #0a0e0a; padding: 0 1; text-style: bold; }
@@ -39,22 +55,34 @@ class DiffModal(ModalScreen):
     def __init__(self, pr: dict) -> None:
         super().__init__()
         self.pr = pr
-        self._raw_lines: list[str] = []
+        # Line indexes over the raw diff, built on first search / file jump
+        self._raw: str = ""
+        self._indexed: bool = False
+        self._raw_lines_lower: list[str] = []
         self._file_starts: list[int] = []
-        self._base_ansi: str = ""
+        # Parsed once in the worker; redraws copy it rather than re-parsing the ANSI
+        self._base_text: RichText = RichText("")
+        self._plain_lower: str = ""
         self._search_query: str = ""
         self._match_lines: list[int] = []
         self._match_idx: int = -1
         self._file_idx: int = 0
+        self._match_cache: dict[str, list[int]] = {}  # lowercased query → matching lines
+        self._last_rendered_query: str | None = None  # query the shown content reflects
 
     def compose(self) -> ComposeResult:
-        with ScrollableContainer(id="diff-scroll"):
-            yield Static("Loading diff…", id="diff-content")
+        # RichLog keeps pre-rendered lines and paints only those in the viewport
+        yield RichLog(id="diff-content", wrap=False, markup=False, highlight=False, auto_scroll=False)
         yield Input(id="search-bar", placeholder="Search…")
         yield Static("", id="search-status")
         yield Footer()
 
     def on_mount(self) -> None:
+        # Widget handles looked up once, not per keystroke / redraw
+        self._log = self.query_one("#diff-content", RichLog)
+        self._search_bar = self.query_one("#search-bar", Input)
+        self._status = self.query_one("#search-status", Static)
+        self._set_content("Loading diff…")
         self.run_worker(self._fetch_diff, thread=True)
 
     def _fetch_diff(self) -> None:
@@ -62,60 +90,140 @@ class DiffModal(ModalScreen):
         if not url:
             self.app.call_from_thread(self._set_content, "No PR URL available.")
             return
-        result = subprocess.run(
-            ["gh", "pr", "diff", url],
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode != 0 or not result.stdout:
-            self.app.call_from_thread(self._set_content, "No diff available.")
-            return
-        raw = result.stdout
-        self._raw_lines = raw.splitlines()
-        self._file_starts = [
-            i for i, line in enumerate(self._raw_lines)
-            if line.startswith("diff --git")
-        ]
-        if shutil.which("delta"):
-            delta = subprocess.run(
-                ["delta", "--color-only"],
-                input=raw,
+        delta = delta_path()
+        chunks = self._stream_through_delta(url, delta) if delta else None
+        if chunks is not None:
+            if not chunks:
+                self.app.call_from_thread(self._set_content, "No diff available.")
+                return
+            # delta --color-only keeps the diff's lines 1:1, so its plain text is the raw diff
+            base_text = RichText("\n").join(chunks)
+            raw = base_text.plain
+        else:
+            result = subprocess.run(
+                ["gh", "pr", "diff", url],
                 capture_output=True,
                 text=True,
             )
-            self._base_ansi = delta.stdout if delta.returncode == 0 else raw
+            if result.returncode != 0 or not result.stdout:
+                self.app.call_from_thread(self._set_content, "No diff available.")
+                return
+            raw = result.stdout
+            # No delta (or it failed): colour +/-/@@ lines directly
+            base_text = colorize_diff(raw)
+        self.app.call_from_thread(
+            self._finish_fetch, base_text, raw, base_text.plain.lower(), chunks is not None,
+        )
+
+    def _stream_through_delta(self, url: str, delta_path: str) -> list[RichText] | None:
+        """Pipe `gh pr diff` into delta and show its output as it arrives.
+
+        Lines are parsed and appended to the log in chunks, so the first file is on
+        screen while the rest is still downloading. Returns the parsed chunks ([] when
+        gh produced no diff), or None if delta failed.
+        """
+        worker = get_current_worker()
+        gh = subprocess.Popen(["gh", "pr", "diff", url], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        delta = subprocess.Popen(
+            [delta_path, "--color-only"], stdin=gh.stdout, stdout=subprocess.PIPE, text=True,
+        )
+        gh.stdout.close()  # delta owns the read end; gh gets SIGPIPE if delta exits early
+        chunks: list[RichText] = []
+        batch: list[str] = []
+
+        def flush() -> None:
+            # Chunks are joined with "\n" later, so drop the batch's final newline
+            chunk = RichText.from_ansi("".join(batch).removesuffix("\n"))
+            chunks.append(chunk)
+            self.app.call_from_thread(self._append_chunk, chunk, len(chunks) == 1)
+            batch.clear()
+
+        for line in delta.stdout:
+            batch.append(line)
+            if len(batch) >= _STREAM_CHUNK_LINES:
+                flush()
+                if worker.is_cancelled:
+                    gh.kill()
+                    delta.kill()
+                    break
+        if batch and not worker.is_cancelled:
+            flush()
+        delta.stdout.close()
+        gh_rc, delta_rc = gh.wait(), delta.wait()
+        if worker.is_cancelled or gh_rc != 0:
+            return []
+        return chunks if delta_rc == 0 else None
+
+    def _append_chunk(self, chunk: RichText, first: bool) -> None:
+        if first:
+            self._log.clear()  # drop the loading message
+        self._log.write(chunk, shrink=False)
+
+    def _finish_fetch(self, base_text: RichText, raw: str, plain_lower: str, streamed: bool) -> None:
+        self._base_text = base_text
+        self._raw = raw
+        self._plain_lower = plain_lower
+        self._indexed = False
+        self._match_cache.clear()  # anything searched while loading saw an empty diff
+        # Streamed output is already on screen; only re-render for a pending search
+        self._last_rendered_query = "" if streamed else None
+        if self._search_query:
+            self._run_search()
         else:
-            from rich.syntax import Syntax
-            from rich.console import Console
-            from io import StringIO
-            buf = StringIO()
-            Console(file=buf, force_terminal=True, width=220, highlight=False).print(
-                Syntax(raw, "diff", theme="monokai")
-            )
-            self._base_ansi = buf.getvalue()
-        self.app.call_from_thread(self._refresh_display)
+            self._refresh_display()
+
+    def _ensure_indexed(self) -> None:
+        """Split the raw diff into searchable lines and locate file headers, once."""
+        if self._indexed or not self._raw:
+            return
+        self._indexed = True
+        raw = self._raw
+        self._raw_lines_lower = raw.lower().splitlines()
+        starts: list[int] = []
+        line_no, last = 0, 0
+        pos = raw.find("diff --git")
+        while pos != -1:
+            if pos == 0 or raw[pos - 1] == "\n":
+                line_no += raw.count("\n", last, pos)
+                last = pos
+                starts.append(line_no)
+            pos = raw.find("diff --git", pos + 10)
+        self._file_starts = starts
 
     def _refresh_display(self) -> None:
-        from rich.text import Text as RichText
-        content = RichText.from_ansi(self._base_ansi)
-        if self._search_query:
-            plain = content.plain
-            query_lower = self._search_query.lower()
-            plain_lower = plain.lower()
-            pos = 0
-            while True:
-                idx = plain_lower.find(query_lower, pos)
-                if idx == -1:
-                    break
-                content.stylize("black on yellow", idx, idx + len(self._search_query))
-                pos = idx + len(self._search_query)
-        self.query_one("#diff-content", Static).update(content)
+        if self._search_query == self._last_rendered_query:
+            return
+        self._last_rendered_query = self._search_query
+        if not self._search_query:
+            self._show(self._base_text)
+            return
+        content = self._base_text.copy()
+        query_lower = self._search_query.lower()
+        plain_lower = self._plain_lower
+        size = len(query_lower)
+        highlights: list[Span] = []
+        idx = plain_lower.find(query_lower)
+        while idx != -1:
+            highlights.append(Span(idx, idx + size, _MATCH_STYLE))
+            idx = plain_lower.find(query_lower, idx + size)
+        content.spans.extend(highlights)  # appended last, so they win over delta's colours
+        self._show(content)
+
+    def _show(self, content: RichText) -> None:
+        """Replace the log's lines with *content*, keeping the scroll position."""
+        log = self._log
+        x, y = log.scroll_offset
+        log.clear()
+        log.write(content, shrink=False)  # full-width lines; scroll sideways for long ones
+        log.scroll_to(x, y, animate=False)
 
     def _set_content(self, content) -> None:
-        self.query_one("#diff-content", Static).update(content)
+        log = self._log
+        log.clear()
+        log.write(content)
 
     def _update_search_status(self) -> None:
-        status = self.query_one("#search-status", Static)
+        status = self._status
         if not self._search_query:
             status.display = False
             return
@@ -128,15 +236,15 @@ class DiffModal(ModalScreen):
         status.display = True
 
     def _scroll_to_line(self, line_idx: int) -> None:
-        self.query_one("#diff-scroll", ScrollableContainer).scroll_to(y=line_idx, animate=False)
+        self._log.scroll_to(y=line_idx, animate=False)
 
     def action_activate_search(self) -> None:
-        bar = self.query_one("#search-bar", Input)
+        bar = self._search_bar
         bar.display = True
         bar.focus()
 
     def action_close(self) -> None:
-        bar = self.query_one("#search-bar", Input)
+        bar = self._search_bar
         if bar.display:
             bar.display = False
             bar.value = ""
@@ -151,7 +259,7 @@ class DiffModal(ModalScreen):
 
     def on_key(self, event) -> None:
         if event.key == "enter":
-            bar = self.query_one("#search-bar", Input)
+            bar = self._search_bar
             if bar.display and bar.has_focus:
                 self._commit_search(bar.value)
             else:
@@ -160,17 +268,25 @@ class DiffModal(ModalScreen):
 
     def _commit_search(self, raw_query: str) -> None:
         query = raw_query.strip()
-        bar = self.query_one("#search-bar", Input)
+        bar = self._search_bar
         bar.display = False
         bar.value = ""
         if not query:
             return
         self._search_query = query
-        query_lower = query.lower()
-        self._match_lines = [
-            i for i, line in enumerate(self._raw_lines)
-            if query_lower in line.lower()
-        ]
+        self._run_search()
+
+    def _run_search(self) -> None:
+        """Find, highlight and jump to matches for the committed search query."""
+        query_lower = self._search_query.lower()
+        self._ensure_indexed()
+        matches = self._match_cache.get(query_lower)
+        if matches is None:
+            matches = self._match_cache[query_lower] = [
+                i for i, line in enumerate(self._raw_lines_lower)
+                if query_lower in line
+            ]
+        self._match_lines = matches
         self._match_idx = 0 if self._match_lines else -1
         self._refresh_display()
         self._update_search_status()
@@ -185,12 +301,14 @@ class DiffModal(ModalScreen):
         self._scroll_to_line(self._match_lines[self._match_idx])
 
     def action_next_file(self) -> None:
+        self._ensure_indexed()
         if not self._file_starts:
             return
         self._file_idx = min(self._file_idx + 1, len(self._file_starts) - 1)
         self._scroll_to_line(self._file_starts[self._file_idx])
 
     def action_prev_file(self) -> None:
+        self._ensure_indexed()
         if not self._file_starts:
             return
         self._file_idx = max(self._file_idx - 1, 0)
@@ -215,6 +333,9 @@ class PrPickerApp(FilterBarMixin, App):
         self.selected_pr: dict | None = None
         self.open_on_enter = open_on_enter
         self.branch_to_switch: str | None = None
+        self._search_blobs: list[str] = [self._search_blob(pr) for pr in prs]
+        self._rendered_rows: list[tuple] = []
+        self._visible_ids: list[int] = []
 
     def compose(self) -> ComposeResult:
         yield Static(context_bar_text(), classes="context-bar")
@@ -231,53 +352,79 @@ class PrPickerApp(FilterBarMixin, App):
         table.add_column("Repo", width=20)
         table.add_column("Source branch", width=26)
         table.add_column("Title")
-        self._populate_table(list(enumerate(self.prs)))
+        self._rendered_rows = [self._render_row(pr) for pr in self.prs]
+        self._show_ids(list(range(len(self.prs))))
         table.focus()
 
-    def _populate_table(self, indexed_prs: list[tuple[int, dict]]) -> None:
-        from rich.text import Text as RichText
+    @staticmethod
+    def _search_blob(pr: dict) -> str:
+        """Lowercased haystack of every filterable column, built once per PR."""
+        parts = [
+            pr.get("_source", "jira"),
+            pr.get("status", ""),
+            pr.get("author", {}).get("name", ""),
+            pr.get("repositoryName", ""),
+            pr.get("source", {}).get("branch", ""),
+            pr.get("name", ""),
+        ]
+        # Newline-joined so a query can't match across column boundaries.
+        return "\n".join(parts).lower()
+
+    @staticmethod
+    def _render_row(pr: dict) -> tuple:
+        status = pr.get("status", "")
+        style = _PR_STATUS_STYLE_OBJS.get(status, _DEFAULT_STATUS_STYLE)
+        author = pr.get("author", {}).get("name", "")
+        source = pr.get("_source", "jira")
+        source_style = _GITHUB_STYLE if source == "github" else _JIRA_STYLE
+        raw_date = pr.get("lastUpdate", "")
+        updated = raw_date[:10] if raw_date else ""
+        return (
+            RichText(source, style=source_style),
+            RichText(status, style=style),
+            RichText(updated, style=_DATE_STYLE),
+            RichText(author, style=_AUTHOR_STYLE),
+            RichText(pr.get("repositoryName", ""), style=_REPO_STYLE),
+            RichText(pr.get("source", {}).get("branch", ""), style=_BRANCH_STYLE),
+            RichText(pr.get("name", ""), style=_TITLE_STYLE),
+        )
+
+    def _show_ids(self, ids: list[int]) -> None:
+        """Show the PRs at *ids* (ascending), touching as few rows as possible.
+
+        Narrowing the filter only removes rows; anything else rebuilds the table
+        from the cached cells, since DataTable can only append rows.
+        """
         table = self.query_one(DataTable)
-        table.clear()
-        for i, pr in indexed_prs:
-            status = pr.get("status", "")
-            style = PR_STATUS_STYLES.get(status, "white")
-            author = pr.get("author", {}).get("name", "")
-            source = pr.get("_source", "jira")
-            source_style = "#00e5ff" if source == "github" else "#ffb300"
-            raw_date = pr.get("lastUpdate", "")
-            updated = raw_date[:10] if raw_date else ""
-            table.add_row(
-                RichText(source, style=source_style),
-                RichText(status, style=style),
-                RichText(updated, style="dim"),
-                RichText(author, style="#b39ddb"),
-                RichText(pr.get("repositoryName", ""), style="#ffb300"),
-                RichText(pr.get("source", {}).get("branch", ""), style="#00e5ff"),
-                RichText(pr.get("name", ""), style="#b8d4b8"),
-                key=str(i),
-            )
+        keep = set(ids)
+        with self.batch_update():
+            if keep.issubset(self._visible_ids):
+                for i in self._visible_ids:
+                    if i not in keep:
+                        table.remove_row(str(i))
+            else:
+                table.clear()
+                rows = self._rendered_rows
+                for i in ids:
+                    table.add_row(*rows[i], key=str(i))
+        self._visible_ids = ids
 
     def on_input_changed(self, event: Input.Changed) -> None:
-        search = event.value.lower()
+        self._schedule_filter(event.value)
+
+    def _apply_filter(self, value: str) -> None:
+        search = value.lower()
         if not search:
-            self._populate_table(list(enumerate(self.prs)))
+            self._show_ids(list(range(len(self.prs))))
             return
-        self._populate_table([
-            (i, p) for i, p in enumerate(self.prs)
-            if search in p.get("_source", "jira").lower()
-            or search in p.get("status", "").lower()
-            or search in p.get("author", {}).get("name", "").lower()
-            or search in p.get("repositoryName", "").lower()
-            or search in p.get("source", {}).get("branch", "").lower()
-            or search in p.get("name", "").lower()
-        ])
+        self._show_ids([i for i, blob in enumerate(self._search_blobs) if search in blob])
 
     def on_key(self, event) -> None:
         if self._handle_filter_keys(event):
             return
 
     def _reset_filter(self) -> None:
-        self._populate_table(list(enumerate(self.prs)))
+        self._show_ids(list(range(len(self.prs))))
 
     def _selected_pr(self) -> dict | None:
         key = cursor_row_key(self.query_one(DataTable))
@@ -287,7 +434,7 @@ class PrPickerApp(FilterBarMixin, App):
         if len(self.screen_stack) > 1:
             top = self.screen
             if isinstance(top, DiffModal):
-                bar = top.query_one("#search-bar", Input)
+                bar = top._search_bar
                 if bar.display and bar.has_focus:
                     top._commit_search(bar.value)
                 else:
@@ -2,18 +2,27 @@
 
 from __future__ import annotations
 
+import os
 import subprocess
+from typing import IO
 
+from rich.text import Text
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.widgets import DataTable, Footer, Static
+from textual.worker import get_current_worker
 
-from ..git import get_default_branch
+from ..git import get_default_branch, get_prunable_branches, invalidate_git_cache
 from .theme import SCREEN_CSS, CONTEXT_BAR_CSS, DATATABLE_CSS, FOOTER_CSS, context_bar_text, cursor_row_key
 from .modals import ConfirmModal
 from .branch import BranchDiffModal
 
 
+def read_fetch_log(log: IO[bytes]) -> str:
+    """Return what the background fetch wrote to its stderr file."""
+    return os.pread(log.fileno(), 1 << 16, 0).decode(errors="replace").strip()
+
+
 class PruneApp(App):
     CSS = SCREEN_CSS + CONTEXT_BAR_CSS + DATATABLE_CSS + FOOTER_CSS
 
@@ -26,9 +35,22 @@ class PruneApp(App):
         Binding("s", "switch_branch", "Switch", show=True),
     ]
 
-    def __init__(self, branches: list[dict]) -> None:
+    def __init__(
+        self,
+        branches: list[dict],
+        fetch: subprocess.Popen | None = None,
+        fetch_log: IO[bytes] | None = None,
+    ) -> None:
         super().__init__()
         self.branches = list(branches)
+        # Only ever wait()ed on — the caller may be waiting on it from another thread
+        self._fetch = fetch
+        self._fetch_log = fetch_log
+        # True until the background fetch has finished and its refresh landed;
+        # deletion waits for it so `git branch -D` never races the fetch
+        # (both take packed-refs.lock) or a table rebuild.
+        self._fetching = fetch is not None
+        self._all_names: set[str] = {b["name"] for b in self.branches}
         self._selected: set[str] = set()
         self.deleted: list[str] = []
         self.branch_to_switch: str | None = None
@@ -39,18 +61,71 @@ class PruneApp(App):
         yield Footer()
 
     def on_mount(self) -> None:
-        from rich.text import Text
         table = self.query_one(DataTable)
         table.add_column("", key="sel", width=3)
         table.add_column("Branch", key="name")
         table.add_column("Status", key="status")
-        for b in self.branches:
-            table.add_row(" ", Text(b["name"], style="#00e5ff"), self._status_text(b["status"]), key=b["name"])
+        self._populate_table(table)
         table.focus()
+        if self._fetch is not None:
+            self.notify("Fetching from origin — the list refreshes when it's done.", timeout=3)
+            self.run_worker(self._await_fetch, thread=True)
+
+    def _populate_table(self, table: DataTable) -> None:
+        with self.batch_update():
+            table.clear()
+            for b in self.branches:
+                name = b["name"]
+                table.add_row(
+                    self._sel_marker(name in self._selected),
+                    Text(name, style="#00e5ff"),
+                    self._status_text(b["status"]),
+                    key=name,
+                )
+
+    def _await_fetch(self) -> None:
+        """Wait for the background `git fetch --prune`, then reclassify the branches."""
+        worker = get_current_worker()
+        while True:
+            try:
+                self._fetch.wait(timeout=0.1)
+                break
+            except subprocess.TimeoutExpired:
+                if worker.is_cancelled:
+                    return
+        invalidate_git_cache()
+        if self._fetch.returncode != 0:
+            err = read_fetch_log(self._fetch_log) if self._fetch_log is not None else ""
+            self.call_from_thread(self._on_fetch_failed, err)
+            return
+        branches = get_prunable_branches()
+        self.call_from_thread(self._update_branches, branches)
+
+    def _on_fetch_failed(self, err: str) -> None:
+        self._fetching = False
+        self.notify(f"Fetch failed: {err}", severity="error", timeout=6)
+
+    def _update_branches(self, branches: list[dict]) -> None:
+        self._fetching = False
+        table = self.query_one(DataTable)
+        cursor_name = self._cursor_branch()
+        gone = set(self.deleted)
+        self.branches = [b for b in branches if b["name"] not in gone]
+        self._all_names = {b["name"] for b in self.branches}
+        self._selected &= self._all_names
+        self._populate_table(table)
+        if table.row_count == 0:
+            if len(self.screen_stack) > 1:
+                # Don't yank the app out from under an open diff view
+                self.notify("No prunable branches left after fetching.")
+            else:
+                self.exit()
+            return
+        if cursor_name in self._all_names:
+            table.move_cursor(row=table.get_row_index(cursor_name))
 
     @staticmethod
     def _status_text(status: str):
-        from rich.text import Text
         if status == "remote deleted":
             t = Text("remote deleted")
             t.stylize("#ffb300")
@@ -61,7 +136,6 @@ class PruneApp(App):
 
     @staticmethod
     def _sel_marker(selected: bool):
-        from rich.text import Text
         if selected:
             t = Text("●")
             t.stylize("bold #00ff41")
@@ -84,20 +158,23 @@ class PruneApp(App):
 
     def action_select_all(self) -> None:
         table = self.query_one(DataTable)
-        all_names = {b["name"] for b in self.branches}
-        if self._selected == all_names:
-            self._selected.clear()
-            for name in all_names:
+        # Only touch rows whose marker actually changes
+        if self._selected == self._all_names:
+            for name in self._selected:
                 table.update_cell(name, "sel", " ")
+            self._selected.clear()
         else:
-            self._selected = all_names.copy()
-            for name in all_names:
+            for name in self._all_names - self._selected:
                 table.update_cell(name, "sel", self._sel_marker(True))
+            self._selected = set(self._all_names)
 
     def action_delete_selected(self) -> None:
         if not self._selected:
             self.notify("No branches selected — press Space to select.", severity="warning")
             return
+        if self._fetching:
+            self.notify("Still fetching from origin — try again in a moment.", severity="warning")
+            return
         count = len(self._selected)
         self.push_screen(
             ConfirmModal(f"Delete {count} selected branch(es)?"),
@@ -107,22 +184,46 @@ class PruneApp(App):
     def _on_confirm_delete(self, confirmed: bool) -> None:
         if not confirmed:
             return
-        table = self.query_one(DataTable)
         to_delete = sorted(self._selected)
+        self.run_worker(lambda: self._delete_branches(to_delete), thread=True)
+
+    def _delete_branches(self, to_delete: list[str]) -> None:
+        # One `git branch -D` for the whole selection. git carries on past a
+        # branch it can't delete, and its error lines don't always name the
+        # branch (e.g. "cannot lock ref 'refs/heads/…'"), so re-list the local
+        # branches afterwards to see which ones are really gone.
+        r = subprocess.run(["git", "branch", "-D", *to_delete], capture_output=True, text=True)
+        invalidate_git_cache()
+        remaining = subprocess.run(
+            ["git", "for-each-ref", "--format=%(refname:lstrip=2)", "refs/heads/"],
+            capture_output=True, text=True,
+        )
+        if remaining.returncode != 0:
+            survivors = set(to_delete)  # can't tell — assume nothing was deleted
+        else:
+            survivors = set(remaining.stdout.splitlines()) & set(to_delete)
+        self.call_from_thread(self._on_branches_deleted, to_delete, survivors, r.stderr)
+
+    def _on_branches_deleted(self, to_delete: list[str], survivors: set[str], stderr: str) -> None:
+        table = self.query_one(DataTable)
         failed = []
+        errors = stderr.strip().splitlines()
         for name in to_delete:
-            r = subprocess.run(["git", "branch", "-D", name], capture_output=True, text=True)
-            if r.returncode == 0:
+            if name not in survivors:
                 self.deleted.append(name)
-                table.remove_row(name)
-                self.branches = [b for b in self.branches if b["name"] != name]
+                if name in table.rows:
+                    table.remove_row(name)
             else:
-                failed.append((name, r.stderr.strip()))
-        self._selected -= set(self.deleted)
+                err = next((e for e in errors if name in e), errors[-1] if errors else "branch still exists")
+                failed.append((name, err))
+        gone = set(self.deleted)
+        self.branches = [b for b in self.branches if b["name"] not in gone]
+        self._all_names -= gone
+        self._selected -= gone
         if failed:
             for name, err in failed:
                 self.notify(f"Failed: {name}: {err}", severity="error", timeout=6)
-        if table.row_count == 0:
+        if table.row_count == 0 and len(self.screen_stack) == 1:
             self.exit()
 
     def action_show_diff(self) -> None:
@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+import shutil
+from functools import lru_cache
+
 from rich.console import Group
 from rich.rule import Rule
 from rich.table import Table
-from rich.text import Text
+from rich.style import Style
+from rich.text import Span, Text
 
 from textual.coordinate import Coordinate
 from textual.widgets import DataTable, Input
+from textual.worker import get_current_worker
 
 from ..config import get_ticket
 from ..git import get_current_branch
@@ -95,6 +100,12 @@ def context_bar_text() -> str:
     return f"  ticket: {ticket}   branch: {branch}"
 
 
+# Static pieces of the ticket info view, built once and shared by every render
+_DESC_RULE = Rule(style="bright_black")
+_DESC_HEADER = Text("DESCRIPTION", style="bold bright_black")
+_BLANK = Text("")
+
+
 def build_ticket_info(issue, jira_server: str) -> Group:
     """Build a Rich renderable with ticket summary, meta table, URL, and description.
 
@@ -102,16 +113,51 @@ def build_ticket_info(issue, jira_server: str) -> Group:
     The caller fetches the issue and passes it in along with the server URL.
     """
     f = issue.fields
-    assignee = f.assignee.displayName if f.assignee else "Unassigned"
-    reporter = f.reporter.displayName if f.reporter else "Unknown"
-    labels = ", ".join(f.labels) if f.labels else "—"
-    priority = f.priority.name if f.priority else "—"
-    status = f.status.name
-    description = (f.description or "").strip()
+    return _ticket_info_content(
+        f.summary,
+        f.status.name,
+        f.priority.name if f.priority else "—",
+        f.assignee.displayName if f.assignee else "Unassigned",
+        f.reporter.displayName if f.reporter else "Unknown",
+        tuple(f.labels or ()),
+        (f.description or "").strip(),
+        f"{jira_server}/browse/{issue.key}",
+    )
+
 
+def build_ticket_info_raw(data: dict, jira_server: str) -> Group:
+    """build_ticket_info() for a raw REST issue payload (see jira_api.get_issue_raw)."""
+    f = data.get("fields") or {}
+    priority = f.get("priority")
+    assignee = f.get("assignee")
+    reporter = f.get("reporter")
+    return _ticket_info_content(
+        f.get("summary") or "",
+        (f.get("status") or {}).get("name", ""),
+        priority["name"] if priority else "—",
+        assignee["displayName"] if assignee else "Unassigned",
+        reporter["displayName"] if reporter else "Unknown",
+        tuple(f.get("labels") or ()),
+        (f.get("description") or "").strip(),
+        f"{jira_server}/browse/{data['key']}",
+    )
+
+
+@lru_cache(maxsize=64)
+def _ticket_info_content(
+    summary: str,
+    status: str,
+    priority: str,
+    assignee: str,
+    reporter: str,
+    labels: tuple[str, ...],
+    description: str,
+    url: str,
+) -> Group:
+    """Render ticket info from plain (hashable) values; reopening the same ticket is a cache hit."""
     status_style = STATUS_STYLES.get(status.lower(), "white")
     priority_style = PRIORITY_STYLES.get(priority.lower(), "white")
-    url = f"{jira_server}/browse/{issue.key}"
+    label_text = ", ".join(labels) if labels else "—"
 
     meta = Table.grid(padding=(0, 3), expand=False)
     meta.add_column(style="bold bright_black", no_wrap=True, min_width=10)
@@ -121,15 +167,15 @@ def build_ticket_info(issue, jira_server: str) -> Group:
     meta.add_row("STATUS", Text(status, style=status_style),
                  "PRIORITY", Text(priority, style=priority_style))
     meta.add_row("ASSIGNEE", assignee, "REPORTER", reporter)
-    meta.add_row("LABELS", Text(labels, style="cyan"), "", "")
+    meta.add_row("LABELS", Text(label_text, style="cyan"), "", "")
 
     truncated = (
         description[:800] + "\n[dim]…truncated[/dim]"
     ) if len(description) > 800 else (description or "[dim]—[/dim]")
 
     desc_block = Group(
-        Rule(style="bright_black"),
-        Text.from_markup("[bold bright_black]DESCRIPTION[/bold bright_black]"),
+        _DESC_RULE,
+        _DESC_HEADER,
         Text.from_markup(f"\n{truncated}"),
     )
 
@@ -139,16 +185,69 @@ def build_ticket_info(issue, jira_server: str) -> Group:
     )
 
     return Group(
-        Text(f.summary, style="bold white"),
-        Text(""),
+        Text(summary, style="bold white"),
+        _BLANK,
         meta,
-        Text(""),
+        _BLANK,
         url_line,
-        Text(""),
+        _BLANK,
         desc_block,
     )
 
 
+def load_ticket_info(issue_future, error_prefix: str = "Error"):
+    """Wait for a prefetched issue (see prefetch_issue) and return its info renderable.
+
+    Returns a red markup string instead if the fetch failed, or None if the view
+    was closed while waiting (its worker is cancelled) — building the Rich content
+    would be wasted. Call from a worker thread.
+    """
+    try:
+        issue = issue_future.result()
+    except Exception as e:
+        return f"[red]{error_prefix}: {e}[/red]"
+    if get_current_worker().is_cancelled:
+        return None
+    return build_ticket_info(issue, get_jira_server())
+
+
+@lru_cache(maxsize=1)
+def delta_path() -> str | None:
+    """Absolute path of the `delta` pager, or None — PATH is searched once per process."""
+    return shutil.which("delta")
+
+
+_DIFF_HEADER_STYLE = Style(bold=True)
+_DIFF_HUNK_STYLE = Style.parse(COL_CYAN)
+_DIFF_ADD_STYLE = Style.parse(COL_GREEN)
+_DIFF_DEL_STYLE = Style.parse(COL_RED)
+
+
+def colorize_diff(raw: str) -> Text:
+    """Colour a unified diff line by line (used when delta is not installed).
+
+    One span per styled line on a single Text — no Pygments pass over the diff.
+    """
+    spans: list[Span] = []
+    pos = 0
+    for line in raw.splitlines(keepends=True):
+        first = line[:1]
+        if first == "+":
+            style = _DIFF_HEADER_STYLE if line.startswith("+++") else _DIFF_ADD_STYLE
+        elif first == "-":
+            style = _DIFF_HEADER_STYLE if line.startswith("---") else _DIFF_DEL_STYLE
+        elif first == "@":
+            style = _DIFF_HUNK_STYLE
+        elif first == "d" and line.startswith("diff "):
+            style = _DIFF_HEADER_STYLE
+        else:
+            style = None
+        if style is not None:
+            spans.append(Span(pos, pos + len(line.rstrip("\r\n")), style))
+        pos += len(line)
+    return Text(raw, spans=spans)
+
+
 def cursor_row_key(table: DataTable) -> str | None:
     """Return the row key at the cursor, or None if the table is empty."""
     if table.row_count == 0:
@@ -156,13 +255,30 @@ def cursor_row_key(table: DataTable) -> str | None:
     return table.coordinate_to_cell_key(Coordinate(table.cursor_row, 0)).row_key.value
 
 
+# Delay before a filter-bar edit is applied; a burst of keystrokes refilters once
+FILTER_DEBOUNCE = 0.05  # seconds
+
+
 class FilterBarMixin:
     """Shared #filter-bar + DataTable key handling.
 
     Subclass must implement:
         _reset_filter() -> None  — repopulate view with unfiltered data
+        _apply_filter(value) -> None  — filter the view (when using _schedule_filter)
     """
 
+    _filter_timer = None
+
+    def _schedule_filter(self, value: str) -> None:
+        """Debounce: apply *value* once typing pauses for FILTER_DEBOUNCE seconds."""
+        if self._filter_timer is not None:
+            self._filter_timer.stop()
+        self._filter_timer = self.set_timer(FILTER_DEBOUNCE, lambda: self._run_filter(value))
+
+    def _run_filter(self, value: str) -> None:
+        self._filter_timer = None
+        self._apply_filter(value)
+
     def action_activate_filter(self) -> None:
         """Show and focus the filter bar."""
         bar = self.query_one("#filter-bar", Input)
@@ -205,31 +321,47 @@ class FilterBarMixin:
         return False
 
 
+_PREVIEW_MAX = 80
+
+
+def _clip(s: str) -> str:
+    return s if len(s) <= _PREVIEW_MAX else s[:_PREVIEW_MAX]
+
+
+def _preview_list(val: list) -> str:
+    if not val:
+        return ""
+    items = []
+    for v in val[:4]:
+        if type(v) is str:
+            items.append(v)
+        elif type(v) is dict:
+            for key in ("name", "value", "displayName", "key"):
+                if key in v:
+                    items.append(str(v[key]))
+                    break
+    preview = ", ".join(items)
+    if len(val) > 4:
+        preview += f" +{len(val) - 4}"
+    return _clip(preview)
+
+
+def _preview_dict(val: dict) -> str:
+    for key in ("value", "name", "displayName", "key"):
+        if key in val:
+            return _clip(str(val[key]))
+    return _clip(str(val))
+
+
+# issue.raw comes straight from JSON, so dispatching on the exact type is safe
+_PREVIEW_BY_TYPE = {str: _clip, list: _preview_list, dict: _preview_dict}
+
+
 def preview_raw_value(val) -> str:
     """Convert a raw JIRA field value (from issue.raw) to a short display string."""
     if val is None:
         return ""
-    if isinstance(val, str):
-        return val[:80]
-    if isinstance(val, list):
-        if not val:
-            return ""
-        items = []
-        for v in val[:4]:
-            if isinstance(v, str):
-                items.append(v)
-            elif isinstance(v, dict):
-                for key in ("name", "value", "displayName", "key"):
-                    if key in v:
-                        items.append(str(v[key]))
-                        break
-        preview = ", ".join(items)
-        if len(val) > 4:
-            preview += f" +{len(val) - 4}"
-        return preview[:80]
-    if isinstance(val, dict):
-        for key in ("value", "name", "displayName", "key"):
-            if key in val:
-                return str(val[key])[:80]
-        return str(val)[:80]
-    return str(val)[:80]
+    preview = _PREVIEW_BY_TYPE.get(type(val))
+    if preview is not None:
+        return preview(val)
+    return _clip(str(val))
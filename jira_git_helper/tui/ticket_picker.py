@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 import sys
-import webbrowser
+from bisect import bisect_left, insort
+from operator import attrgetter
 
 import click
-from jira import JIRAError
+from rich.text import Text
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.coordinate import Coordinate
@@ -23,8 +24,8 @@ from ..config import (
     get_fields_for_project,
     get_filters_for_project,
     set_filters_for_project,
+    set_filters_and_default,
     get_active_filter_name,
-    set_active_filter_name,
     get_effective_filter_name,
     _session_active_filters,
 )
@@ -32,25 +33,33 @@ from ..git import copy_to_clipboard
 from ..jira_api import (
     get_jira_server,
     get_jira_client,
+    ensure_fields_cached,
     get_jira_field_name,
     fetch_issues_for_projects,
+    prefetch_issue,
+    TICKET_INFO_FIELDS,
     STATUS_STYLES,
     PRIORITY_STYLES,
 )
 from .theme import (
     SCREEN_CSS, CONTEXT_BAR_CSS, DATATABLE_CSS, FILTER_BAR_CSS, FOOTER_CSS,
-    context_bar_text, preview_raw_value, build_ticket_info,
+    context_bar_text, preview_raw_value, load_ticket_info,
     cursor_row_key, FilterBarMixin,
 )
 from .modals import TextInputModal, ConfirmModal
 
 
+_status_name = attrgetter("fields.status.name")
+
+
 def ensure_ticket() -> str:
     """Return the current ticket. If none is set, show the interactive picker."""
     ticket = get_ticket()
     if ticket:
         return ticket
 
+    from jira import JIRAError
+
     jira = get_jira_client()
     click.echo("No ticket set — fetching tickets…", err=True)
 
@@ -110,10 +119,18 @@ class JiraListApp(FilterBarMixin, App):
         self.selected_ticket: str | None = None
         self.jira_client = jira_client
         self.extra_field_ids: list[str] = extra_field_ids or []
+        self._field_getters: list[tuple[str, attrgetter]] = [
+            (fid, attrgetter(f"fields.{fid}")) for fid in self.extra_field_ids
+        ]
         self.field_names: dict[str, str] = field_names or {}
         self.reload_needed: bool = False
         self.projects: list[str] = projects or []
         self._tree_mode: bool = False
+        self._search_index: dict[str, str] = {
+            issue.key: self._search_text(issue) for issue in issues
+        }
+        # Parent graph only changes with all_issues (a refresh builds a new app)
+        self._tree_roots, self._tree_children = self._build_issue_tree()
 
     def compose(self) -> ComposeResult:
         yield Static(context_bar_text(), classes="context-bar")
@@ -124,19 +141,30 @@ class JiraListApp(FilterBarMixin, App):
         yield Footer()
 
     def on_mount(self) -> None:
-        table = self.query_one(DataTable)
+        # Cached once — these are hit on every keystroke
+        self._table = table = self.query_one(DataTable)
+        self._tree = self.query_one(Tree)
+        self._filter_bar = self.query_one("#filter-bar", Input)
+        self._filter_status = self.query_one("#filter-status", Static)
         table.add_column("Key", width=14)
         table.add_column("Status", width=16)
         table.add_column("Assignee", width=20)
         for fid in self.extra_field_ids:
             table.add_column(self.field_names.get(fid, fid), width=16)
         table.add_column("Summary")
-        self._populate_table(self.all_issues)
+        self._row_cache: dict[str, tuple] = {
+            issue.key: self._row_cells(issue) for issue in self.all_issues
+        }
+        self._show_keys([i.key for i in self.all_issues])
         self._update_filter_status()
         table.focus()
 
-    def _field_str(self, issue, field_id: str) -> str:
-        val = getattr(issue.fields, field_id, None)
+    @staticmethod
+    def _field_str(issue, getter: attrgetter) -> str:
+        try:
+            val = getter(issue)
+        except AttributeError:
+            return ""
         if val is None:
             return ""
         if isinstance(val, str):
@@ -148,27 +176,32 @@ class JiraListApp(FilterBarMixin, App):
                 return str(s)
         return str(val)
 
-    def _populate_table(self, issues: list) -> None:
-        from rich.text import Text
-        table = self.query_one(DataTable)
-        table.clear()
-        self.visible_keys = []
-        for issue in issues:
-            assignee = (
-                issue.fields.assignee.displayName
-                if issue.fields.assignee
-                else "Unassigned"
-            )
-            row = [
-                Text(issue.key, style="bold #00e5ff"),
-                Text(issue.fields.status.name, style="#ffb300"),
-                Text(assignee, style="#b39ddb"),
-            ]
-            for fid in self.extra_field_ids:
-                row.append(Text(self._field_str(issue, fid), style="#b8d4b8"))
-            row.append(Text(issue.fields.summary, style="#b8d4b8"))
-            table.add_row(*row, key=issue.key)
-            self.visible_keys.append(issue.key)
+    def _row_cells(self, issue) -> tuple:
+        """Build the styled DataTable cells for *issue* (cached in _row_cache)."""
+        assignee = (
+            issue.fields.assignee.displayName
+            if issue.fields.assignee
+            else "Unassigned"
+        )
+        row = [
+            Text(issue.key, style="bold #00e5ff"),
+            Text(_status_name(issue), style="#ffb300"),
+            Text(assignee, style="#b39ddb"),
+        ]
+        for _, getter in self._field_getters:
+            row.append(Text(self._field_str(issue, getter), style="#b8d4b8"))
+        row.append(Text(issue.fields.summary, style="#b8d4b8"))
+        return tuple(row)
+
+    def _show_keys(self, keys: list[str]) -> None:
+        """Repopulate the table with the cached rows for *keys*, in order."""
+        table = self._table
+        rows = self._row_cache
+        with self.batch_update():
+            table.clear()
+            for key in keys:
+                table.add_row(*rows[key], key=key)
+        self.visible_keys = keys
 
     # --- tree helpers ---
 
@@ -186,27 +219,45 @@ class JiraListApp(FilterBarMixin, App):
                 roots.append(issue)
         return roots, children
 
+    def _search_text(self, issue) -> str:
+        """Lowercased haystack of every filterable column, built once per issue."""
+        f = issue.fields
+        parts = [
+            issue.key,
+            f.summary or "",
+            f.assignee.displayName if f.assignee else "",
+            _status_name(issue),
+            *(self._field_str(issue, getter) for _, getter in self._field_getters),
+        ]
+        # Newline-joined so a query can't match across column boundaries.
+        return "\n".join(parts).lower()
+
     def _issue_matches_filter(self, issue, query: str) -> bool:
-        q = query.lower()
-        return (
-            q in issue.key.lower()
-            or q in issue.fields.summary.lower()
-            or q in (issue.fields.assignee.displayName.lower() if issue.fields.assignee else "")
-            or q in issue.fields.status.name.lower()
-            or any(q in self._field_str(issue, fid).lower() for fid in self.extra_field_ids)
-        )
+        return query.lower() in self._search_index[issue.key]
 
-    def _branch_matches(self, issue, children: dict, query: str) -> bool:
+    def _matching_branches(self, roots: list, children: dict, query: str) -> set[str]:
+        """Return keys of issues that match *query* or have a matching descendant.
+
+        One post-order pass over the tree, so each issue is tested exactly once.
+        """
         if not query:
-            return True
-        if self._issue_matches_filter(issue, query):
-            return True
-        return any(self._branch_matches(c, children, query) for c in children.get(issue.key, []))
+            return set(self._search_index)
+        matched: set[str] = set()
+
+        def visit(issue) -> bool:
+            kid_hits = [visit(c) for c in children.get(issue.key, [])]
+            if any(kid_hits) or self._issue_matches_filter(issue, query):
+                matched.add(issue.key)
+                return True
+            return False
+
+        for issue in roots:
+            visit(issue)
+        return matched
 
     def _tree_node_label(self, issue, dim: bool = False):
-        from rich.text import Text
         assignee = issue.fields.assignee.displayName if issue.fields.assignee else "Unassigned"
-        status = issue.fields.status.name
+        status = _status_name(issue)
         summary = (issue.fields.summary or "")[:80]
         t = Text()
         t.append(issue.key, style="#4d8a4d" if dim else "bold #00e5ff")
@@ -219,35 +270,32 @@ class JiraListApp(FilterBarMixin, App):
         return t
 
     def _populate_tree(self, query: str = "") -> None:
-        from rich.text import Text
-        tree = self.query_one(Tree)
+        tree = self._tree
         tree.clear()
         tree.root.label = Text("issues", style="#1a3a1a")
-        roots, children = self._build_issue_tree()
+        roots, children = self._tree_roots, self._tree_children
+        visible = self._matching_branches(roots, children, query)
         for issue in roots:
-            if self._branch_matches(issue, children, query):
-                self._add_tree_node(tree.root, issue, children, query)
+            if issue.key in visible:
+                self._add_tree_node(tree.root, issue, children, query, visible)
         tree.root.expand()
 
-    def _add_tree_node(self, parent_node, issue, children: dict, query: str) -> None:
+    def _add_tree_node(self, parent_node, issue, children: dict, query: str, visible: set[str]) -> None:
         matches_directly = not query or self._issue_matches_filter(issue, query)
         label = self._tree_node_label(issue, dim=not matches_directly)
-        visible_children = [
-            c for c in children.get(issue.key, [])
-            if self._branch_matches(c, children, query)
-        ]
+        visible_children = [c for c in children.get(issue.key, []) if c.key in visible]
         if visible_children:
             node = parent_node.add(label, data=issue, expand=True)
             for child in visible_children:
-                self._add_tree_node(node, child, children, query)
+                self._add_tree_node(node, child, children, query, visible)
         else:
             parent_node.add_leaf(label, data=issue)
 
     def action_toggle_tree(self) -> None:
         self._tree_mode = not self._tree_mode
-        table = self.query_one(DataTable)
-        tree = self.query_one(Tree)
-        query = self.query_one("#filter-bar", Input).value
+        table = self._table
+        tree = self._tree
+        query = self._filter_bar.value
         if self._tree_mode:
             table.display = False
             tree.display = True
@@ -267,7 +315,7 @@ class JiraListApp(FilterBarMixin, App):
 
     def _active_key(self) -> str | None:
         if self._tree_mode:
-            tree = self.query_one(Tree)
+            tree = self._tree
             node = tree.cursor_node
             if node and node.data:
                 return node.data.key
@@ -275,22 +323,25 @@ class JiraListApp(FilterBarMixin, App):
         return self._cursor_key()
 
     def on_input_changed(self, event: Input.Changed) -> None:
-        query = event.value.lower()
+        self._schedule_filter(event.value)
+
+    def _apply_filter(self, value: str) -> None:
+        query = value.lower()
         if self._tree_mode:
             self._populate_tree(query)
             return
         if not query:
-            self._populate_table(self.all_issues)
+            self._show_keys([i.key for i in self.all_issues])
             return
-        filtered = [i for i in self.all_issues if self._issue_matches_filter(i, query)]
-        self._populate_table(filtered)
+        index = self._search_index
+        self._show_keys([i.key for i in self.all_issues if query in index[i.key]])
 
     def on_key(self, event) -> None:
         if len(self.screen_stack) > 1:
             return
 
         focused = self.focused
-        filter_bar = self.query_one("#filter-bar", Input)
+        filter_bar = self._filter_bar
 
         # Custom Input handling for tree/table dual mode
         if isinstance(focused, Input) and focused.id == "filter-bar":
@@ -298,7 +349,7 @@ class JiraListApp(FilterBarMixin, App):
                 focused.value = ""
                 focused.display = False
                 self._reset_filter()
-                (self.query_one(Tree) if self._tree_mode else self.query_one(DataTable)).focus()
+                (self._tree if self._tree_mode else self._table).focus()
                 event.prevent_default()
                 return
             return
@@ -319,10 +370,10 @@ class JiraListApp(FilterBarMixin, App):
         if self._tree_mode:
             self._populate_tree()
         else:
-            self._populate_table(self.all_issues)
+            self._show_keys([i.key for i in self.all_issues])
 
     def _cursor_key(self) -> str | None:
-        return cursor_row_key(self.query_one(DataTable))
+        return cursor_row_key(self._table)
 
     def action_select_ticket(self) -> None:
         if len(self.screen_stack) > 1:
@@ -336,7 +387,7 @@ class JiraListApp(FilterBarMixin, App):
                 top.dismiss(True)
             return
         if isinstance(self.focused, Input):
-            (self.query_one(Tree) if self._tree_mode else self.query_one(DataTable)).focus()
+            (self._tree if self._tree_mode else self._table).focus()
             return
         key = self._active_key()
         if key:
@@ -348,6 +399,7 @@ class JiraListApp(FilterBarMixin, App):
             return
         key = self._active_key()
         if key:
+            import webbrowser
             server = get_jira_server()
             webbrowser.open(f"{server}/browse/{key}")
 
@@ -372,9 +424,10 @@ class JiraListApp(FilterBarMixin, App):
 
     def _fetch_fields_worker(self, key: str) -> None:
         full_issue = self.jira_client.issue(key)
+        raw_fields = full_issue.raw.get("fields", {})
+        ensure_fields_cached(self.jira_client, raw_fields)
         project = key.split("-")[0]
         current = set(get_fields_for_project(project))
-        raw_fields = full_issue.raw.get("fields", {})
         field_list = []
         for fid, raw_val in raw_fields.items():
             if raw_val is None or raw_val == [] or raw_val == "":
@@ -402,7 +455,7 @@ class JiraListApp(FilterBarMixin, App):
         self.exit()
 
     def _update_filter_status(self) -> None:
-        status = self.query_one("#filter-status", Static)
+        status = self._filter_status
         if not self.projects:
             status.display = False
             return
@@ -457,6 +510,8 @@ class FieldPickerModal(ModalScreen):
         super().__init__()
         self._fields = fields
         self.selected_ids = set(selected_ids)
+        # Kept in sorted order as fields are toggled, so saving needs no sort
+        self._selected_sorted: list[str] = sorted(self.selected_ids)
         self.project = project
 
     def compose(self) -> ComposeResult:
@@ -479,24 +534,24 @@ class FieldPickerModal(ModalScreen):
             table.add_row(marker, fname, fid, fval, key=fid)
         table.focus()
 
-    def on_key(self, event) -> None:
-        if event.key == "space":
-            table = self.query_one("#fp-table", DataTable)
-            fid = cursor_row_key(table)
-            if fid is None:
-                return
-            if fid in self.selected_ids:
-                self.selected_ids.discard(fid)
-            else:
-                self.selected_ids.add(fid)
-            marker = "✓" if fid in self.selected_ids else " "
-            table.update_cell_at(Coordinate(table.cursor_row, 0), marker)
-            event.prevent_default()
+    def action_toggle_field(self) -> None:
+        table = self.query_one("#fp-table", DataTable)
+        fid = cursor_row_key(table)
+        if fid is None:
+            return
+        if fid in self.selected_ids:
+            self.selected_ids.discard(fid)
+            del self._selected_sorted[bisect_left(self._selected_sorted, fid)]
+        else:
+            self.selected_ids.add(fid)
+            insort(self._selected_sorted, fid)
+        marker = "✓" if fid in self.selected_ids else " "
+        table.update_cell_at(Coordinate(table.cursor_row, 0), marker)
 
     def action_confirm(self) -> None:
         set_config(
             f"fields.{self.project}",
-            ",".join(sorted(self.selected_ids)),
+            ",".join(self._selected_sorted),
         )
         self.dismiss(self.selected_ids)
 
@@ -526,8 +581,21 @@ class FilterListModal(ModalScreen):
     def __init__(self, project: str) -> None:
         super().__init__()
         self.project = project
-        self._filters: list[dict] = get_filters_for_project(project)
+        # name → the same dict held in _filters. Names key the table rows, so a
+        # hand-edited duplicate is dropped (first wins, as in JQL resolution).
+        self._by_name: dict[str, dict] = {}
+        for f in get_filters_for_project(project):
+            self._by_name.setdefault(f["name"], f)
+        self._filters: list[dict] = list(self._by_name.values())
+        self._markers: dict[str, str] = {}  # filter name → marker currently shown
+        # Snapshot of the filter state; kept in step by the actions that change it
+        self._effective: str | None = get_effective_filter_name(project)
+        self._default: str | None = get_active_filter_name(project)
         self._changed = False
+        # Filter list and default changes are kept in memory and written once,
+        # when the modal closes or is unmounted (e.g. the app quits under it)
+        self._dirty_filters = False
+        self._dirty_default = False
 
     def compose(self) -> ComposeResult:
         with Vertical(id="fl-dialog"):
@@ -540,69 +608,73 @@ class FilterListModal(ModalScreen):
 
     def on_mount(self) -> None:
         table = self.query_one("#fl-table", DataTable)
-        table.add_column(" ", width=3)
-        table.add_column("Name", width=28)
-        table.add_column("JQL")
+        table.add_column(" ", width=3, key="marker")
+        table.add_column("Name", width=28, key="name")
+        table.add_column("JQL", key="jql")
         self._refresh_table()
         table.focus()
 
+    @staticmethod
+    def _marker_for(name: str, effective: str | None, default: str | None) -> str:
+        if name == effective:
+            return "▶" if name != default else "●"
+        if name == default:
+            return "○"
+        return " "
+
     def _refresh_table(self) -> None:
+        """Populate the table from scratch (on mount). Rows are keyed by filter name."""
         table = self.query_one("#fl-table", DataTable)
-        cursor = table.cursor_row
-        table.clear()
-        effective = get_effective_filter_name(self.project)
-        default = get_active_filter_name(self.project)
-        for i, f in enumerate(self._filters):
-            name = f["name"]
-            if name == effective:
-                marker = "▶" if name != default else "●"
-            elif name == default:
-                marker = "○"
-            else:
-                marker = " "
-            table.add_row(marker, name, f["jql"], key=str(i))
-        if table.row_count > 0:
-            table.move_cursor(row=min(cursor, table.row_count - 1))
+        effective, default = self._effective, self._default
+        self._markers = {}
+        with self.app.batch_update():
+            table.clear()
+            for f in self._filters:
+                name = f["name"]
+                marker = self._markers[name] = self._marker_for(name, effective, default)
+                table.add_row(marker, name, f["jql"], key=name)
+
+    def _refresh_markers(self) -> None:
+        """Update only the marker cells whose state changed (usually old + new default)."""
+        table = self.query_one("#fl-table", DataTable)
+        effective, default = self._effective, self._default
+        for name, shown in self._markers.items():
+            marker = self._marker_for(name, effective, default)
+            if marker != shown:
+                table.update_cell(name, "marker", marker)
+                self._markers[name] = marker
 
-    def _cursor_idx(self) -> int | None:
-        key = cursor_row_key(self.query_one("#fl-table", DataTable))
-        return int(key) if key is not None else None
+    def _cursor_name(self) -> str | None:
+        return cursor_row_key(self.query_one("#fl-table", DataTable))
 
     def action_activate_filter_entry(self) -> None:
         self._do_activate()
 
-    def on_key(self, event) -> None:
-        if event.key == "space":
-            self._do_set_default()
-            event.prevent_default()
-
     def _do_activate(self) -> None:
-        idx = self._cursor_idx()
-        if idx is None:
+        name = self._cursor_name()
+        if name is None:
             return
-        name = self._filters[idx]["name"]
-        current = get_effective_filter_name(self.project)
-        if current == name:
+        if self._effective == name:
             _session_active_filters.pop(self.project, None)
         else:
             _session_active_filters[self.project] = name
         self._changed = True
+        self._flush_filters()
         self.dismiss(True)
 
-    def _do_set_default(self) -> None:
-        idx = self._cursor_idx()
-        if idx is None:
+    def action_set_default(self) -> None:
+        name = self._cursor_name()
+        if name is None:
             return
-        name = self._filters[idx]["name"]
-        current_default = get_active_filter_name(self.project)
-        if current_default == name:
-            set_active_filter_name(self.project, None)
+        if self._default == name:
             _session_active_filters.pop(self.project, None)
+            self._default = self._effective = None
         else:
-            set_active_filter_name(self.project, name)
             _session_active_filters[self.project] = name
+            self._default = self._effective = name
+        self._dirty_default = True
         self._changed = True
-        self._refresh_table()
+        self._refresh_markers()
 
     def action_new_filter(self) -> None:
         self.app.push_screen(
@@ -613,7 +685,7 @@ class FilterListModal(ModalScreen):
     def _on_new_name(self, name: str | None) -> None:
         if not name:
             return
-        if any(f["name"] == name for f in self._filters):
+        if name in self._by_name:
             return
         default_jql = f"project = {self.project} AND assignee = currentUser() ORDER BY updated DESC"
         self.app.push_screen(
@@ -624,16 +696,20 @@ class FilterListModal(ModalScreen):
     def _on_new_jql(self, name: str, jql: str | None) -> None:
         if not jql:
             return
-        self._filters.append({"name": name, "jql": jql})
-        set_filters_for_project(self.project, self._filters)
-        self._refresh_table()
+        entry = {"name": name, "jql": jql}
+        self._filters.append(entry)
+        self._by_name[name] = entry
+        self._dirty_filters = True
+        table = self.query_one("#fl-table", DataTable)
+        self._markers[name] = " "  # a new filter is neither active nor default
+        table.add_row(" ", name, jql, key=name)
+        table.move_cursor(row=table.row_count - 1)
 
     def action_edit_filter(self) -> None:
-        idx = self._cursor_idx()
-        if idx is None:
+        name = self._cursor_name()
+        if name is None:
             return
-        name = self._filters[idx]["name"]
-        current_jql = self._filters[idx]["jql"]
+        current_jql = self._by_name[name]["jql"]
         self.app.push_screen(
             TextInputModal("Edit JQL", initial=current_jql),
             lambda jql: self._on_edit_jql(name, jql),
@@ -642,18 +718,14 @@ class FilterListModal(ModalScreen):
     def _on_edit_jql(self, name: str, jql: str | None) -> None:
         if not jql:
             return
-        for f in self._filters:
-            if f["name"] == name:
-                f["jql"] = jql
-                break
-        set_filters_for_project(self.project, self._filters)
-        self._refresh_table()
+        self._by_name[name]["jql"] = jql  # same dict as in _filters
+        self._dirty_filters = True
+        self.query_one("#fl-table", DataTable).update_cell(name, "jql", jql)
 
     def action_delete_filter(self) -> None:
-        idx = self._cursor_idx()
-        if idx is None:
+        name = self._cursor_name()
+        if name is None:
             return
-        name = self._filters[idx]["name"]
         self.app.push_screen(
             ConfirmModal(f"Delete filter '{name}'?"),
             lambda confirmed: self._on_delete_confirmed(name, confirmed),
@@ -662,16 +734,37 @@ class FilterListModal(ModalScreen):
     def _on_delete_confirmed(self, name: str, confirmed: bool | None) -> None:
         if not confirmed:
             return
-        self._filters = [f for f in self._filters if f["name"] != name]
-        set_filters_for_project(self.project, self._filters)
-        if get_active_filter_name(self.project) == name:
-            set_active_filter_name(self.project, None)
+        self._filters.remove(self._by_name.pop(name))
+        self._dirty_filters = True
         if _session_active_filters.get(self.project) == name:
             _session_active_filters.pop(self.project, None)
+        if self._default == name:
+            # Cleared explicitly on flush, so re-creating a filter with this
+            # name before closing doesn't bring the old default back
+            self._default = None
+            self._dirty_default = True
+        if self._effective == name:
+            self._effective = self._default
         self._changed = True
-        self._refresh_table()
+        table = self.query_one("#fl-table", DataTable)
+        table.remove_row(name)
+        del self._markers[name]
+        self._refresh_markers()
+
+    def _flush_filters(self) -> None:
+        if self._dirty_default:
+            set_filters_and_default(
+                self.project, self._filters if self._dirty_filters else None, self._default
+            )
+        elif self._dirty_filters:
+            set_filters_for_project(self.project, self._filters)
+        self._dirty_filters = self._dirty_default = False
+
+    def on_unmount(self) -> None:
+        self._flush_filters()
 
     def action_close_modal(self) -> None:
+        self._flush_filters()
         self.dismiss(self._changed)
 
 
@@ -690,6 +783,8 @@ class TicketInfoModal(ModalScreen):
         super().__init__()
         self._key = key
         self._jira_client = jira_client
+        # Started now so the round-trip overlaps with compose/mount
+        self._issue_future = prefetch_issue(jira_client, key, TICKET_INFO_FIELDS)
 
     def compose(self) -> ComposeResult:
         with Vertical(id="ti-container"):
@@ -702,17 +797,9 @@ class TicketInfoModal(ModalScreen):
         self.run_worker(self._fetch_info, thread=True)
 
     def _fetch_info(self) -> None:
-        try:
-            issue = self._jira_client.issue(
-                self._key,
-                fields=["summary", "status", "assignee", "reporter", "priority", "labels", "description", "issuetype"],
-            )
-        except Exception as e:
-            self.app.call_from_thread(self._update_content, f"[red]Error: {e}[/red]")
-            return
-
-        content = build_ticket_info(issue, get_jira_server())
-        self.app.call_from_thread(self._update_content, content)
+        content = load_ticket_info(self._issue_future)
+        if content is not None:
+            self.app.call_from_thread(self._update_content, content)
 
     def _update_content(self, content) -> None:
         self.query_one("#ti-content", Static).update(content)
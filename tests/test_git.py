@@ -0,0 +1,36 @@
+"""Tests for porcelain status parsing in git.py."""
+
+import subprocess
+
+import pytest
+
+from jira_git_helper import git
+
+
+def _status(monkeypatch: pytest.MonkeyPatch, stdout: bytes):
+    def fake_run(cmd, **kwargs):
+        return subprocess.CompletedProcess(cmd, 0, stdout=stdout, stderr=b"")
+
+    monkeypatch.setattr(git.subprocess, "run", fake_run)
+    return git._run_git_status()
+
+
+def test_index_rename_consumes_source_path(monkeypatch):
+    staged, modified, deleted, untracked = _status(
+        monkeypatch, b"R  new.txt\0old.txt\0?? sp ace.txt\0"
+    )
+    assert staged == [("R", "new.txt")]
+    assert modified == []
+    assert deleted == []
+    assert untracked == [("?", "sp ace.txt")]
+
+
+def test_worktree_rename_consumes_source_path(monkeypatch):
+    # Y == 'R' (e.g. after `git add -N`) also emits the source path as its own entry
+    staged, modified, deleted, untracked = _status(
+        monkeypatch, b" R wt_new.txt\0staged_rename.txt\0?? sp ace.txt\0"
+    )
+    assert staged == []
+    assert modified == [("R", "wt_new.txt")]
+    assert deleted == []
+    assert untracked == [("?", "sp ace.txt")]